@@ -9,58 +9,159 @@ import asyncio
 import logging
 import sys
 import os
+import io
+import locale
+import time
 import threading
-import signal
-import atexit
+import queue
+import functools
+import importlib.util
 from pathlib import Path
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from logging.handlers import RotatingFileHandler
 from typing import Optional
 
+# uvloop is POSIX-only; fall back to the stdlib loop elsewhere
+if sys.platform != 'win32':
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+else:
+    uvloop = None
+
 # ===== PATH CONFIGURATION =====
 PROJECT_ROOT = Path(__file__).parent
 SRC_DIR = PROJECT_ROOT / "src"
+LOGS_DIR = PROJECT_ROOT / "logs"
+LOG_FILE = LOGS_DIR / "bot.log"
+DATA_DIR = PROJECT_ROOT / "data"
+ENV_FILE = PROJECT_ROOT / ".env"
 
 # Add paths to Python path for clean imports
-for path in [str(PROJECT_ROOT), str(SRC_DIR)]:
-    if path not in sys.path:
+_known_paths = set(sys.path)
+for path in (str(PROJECT_ROOT), str(SRC_DIR)):
+    if path not in _known_paths:
         sys.path.insert(0, path)
 
+logger = logging.getLogger(__name__)
+
 
 # ===== LOGGING SETUP =====
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that coalesces writes in a large buffer and flushes on a timer"""
+
+    buffer_size = 64 * 1024  # 64KiB
+    flush_interval = 1.0  # seconds
+
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        super().__init__(*args, **kwargs)
+
+        # Python 3.10+ stores encoding='locale' when UTF-8 mode is off, which isn't a codec name
+        if self.encoding in (None, 'locale'):
+            self._codec = locale.getpreferredencoding(False)
+        else:
+            self._codec = self.encoding
+
+        # Periodic flush so quiet periods still reach disk
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="LogFlushThread", daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        """Open the log file as a raw binary stream behind a large write buffer"""
+        raw = open(self.baseFilename, 'ab', buffering=0)
+        self._size = os.fstat(raw.fileno()).st_size
+        return io.BufferedWriter(raw, buffer_size=self.buffer_size)
+
+    def _flush_loop(self):
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def doRollover(self):
+        """Flush buffered records before rotating"""
+        if self.stream:
+            self.stream.flush()
+        super().doRollover()
+
+    def emit(self, record):
+        """Write the encoded record straight into the byte buffer"""
+        try:
+            data = f"{self.format(record)}{self.terminator}".encode(self._codec, 'backslashreplace')
+
+            if self.stream is None:
+                self.stream = self._open()
+
+            # Track the file size ourselves; seek/tell would flush the buffer
+            if self.maxBytes > 0 and self._size + len(data) >= self.maxBytes:
+                self.doRollover()
+
+            self.stream.write(data)
+            self._size += len(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
 def setup_logging():
     """Setup comprehensive logging system"""
     try:
         # Import settings after path is configured
         from config.settings import settings
 
-        # Create logs directory
-        logs_dir = PROJECT_ROOT / "logs"
-        logs_dir.mkdir(exist_ok=True)
-
         # Configure logging format
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
         # Setup handlers
-        handlers = [logging.StreamHandler(sys.stdout)]
+        log_formatter = logging.Formatter(log_format)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(log_formatter)
+        handlers = [stream_handler]
 
         # Add file handler if possible
         try:
-            from logging.handlers import RotatingFileHandler
-            file_handler = RotatingFileHandler(
-                logs_dir / "bot.log",
+            LOGS_DIR.mkdir(exist_ok=True)
+            file_handler = BufferedRotatingFileHandler(
+                LOG_FILE,
                 maxBytes=10 * 1024 * 1024,  # 10MB
                 backupCount=5
             )
-            file_handler.setFormatter(logging.Formatter(log_format))
+            file_handler.setFormatter(log_formatter)
             handlers.append(file_handler)
         except Exception as e:
             print(f"⚠️  Could not setup file logging: {e}")
 
+            # Read-only filesystems: fall back to the local syslog socket if there is one
+            if os.path.exists('/dev/log'):
+                from logging.handlers import SysLogHandler
+                syslog_handler = SysLogHandler(address='/dev/log', facility=SysLogHandler.LOG_USER)
+                syslog_handler.setFormatter(logging.Formatter('ladbot: %(name)s - %(levelname)s - %(message)s'))
+                handlers.append(syslog_handler)
+
+        # Move handler I/O off the event loop: log calls only enqueue records,
+        # a background listener thread formats and writes them
+        import atexit
+        from logging.handlers import QueueHandler, QueueListener
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+        # Records are fully formatted by the listener's handlers
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
         # Configure root logger
         logging.basicConfig(
             level=getattr(logging, settings.LOG_LEVEL),
-            format=log_format,
-            handlers=handlers,
+            handlers=[queue_handler],
             force=True
         )
 
@@ -74,10 +175,9 @@ def setup_logging():
         logging.getLogger('ladbot').setLevel(logging.INFO)
         logging.getLogger('web').setLevel(logging.INFO)
 
-        logger = logging.getLogger(__name__)
         logger.info("✅ Logging system configured")
-        logger.info(f"📁 Log files: {logs_dir}")
-        logger.info(f"📊 Log level: {settings.LOG_LEVEL}")
+        logger.info("📁 Log files: %s", LOGS_DIR)
+        logger.info("📊 Log level: %s", settings.LOG_LEVEL)
 
         return True
 
@@ -93,25 +193,63 @@ def setup_logging():
 
 
 # ===== ENVIRONMENT DETECTION =====
+@dataclass(frozen=True)
+class Environment:
+    """Deployment environment variables, read once from os.environ"""
+    __slots__ = ('render', 'railway', 'heroku', 'vercel', 'port', 'render_url', 'heroku_app_name')
+
+    render: bool
+    railway: bool
+    heroku: bool
+    vercel: bool
+    port: int
+    render_url: Optional[str]
+    heroku_app_name: Optional[str]
+
+    @classmethod
+    def from_os(cls) -> 'Environment':
+        return cls(
+            render=bool(os.getenv('RENDER')),
+            railway=bool(os.getenv('RAILWAY_ENVIRONMENT') or os.getenv('RAILWAY_PROJECT_ID')),
+            heroku=bool(os.getenv('HEROKU_APP_NAME')),
+            vercel=bool(os.getenv('VERCEL')),
+            port=int(os.environ.get('PORT', 8080)),
+            render_url=os.getenv('RENDER_EXTERNAL_URL'),
+            heroku_app_name=os.getenv('HEROKU_APP_NAME')
+        )
+
+
+# Deployment environment is fixed for the process lifetime, so these are cached.
+# Loaded on first use rather than at import so a .env file is applied first.
+@functools.lru_cache(maxsize=None)
+def get_environment() -> Environment:
+    """Get the deployment environment"""
+    return Environment.from_os()
+
+
+@functools.lru_cache(maxsize=None)
 def detect_platform() -> str:
     """Detect deployment platform"""
-    if os.getenv('RENDER'):
+    env = get_environment()
+    if env.render:
         return 'render'
-    elif os.getenv('RAILWAY_ENVIRONMENT') or os.getenv('RAILWAY_PROJECT_ID'):
+    elif env.railway:
         return 'railway'
-    elif os.getenv('HEROKU_APP_NAME'):
+    elif env.heroku:
         return 'heroku'
-    elif os.getenv('VERCEL'):
+    elif env.vercel:
         return 'vercel'
     else:
         return 'local'
 
 
+@functools.lru_cache(maxsize=None)
 def get_port() -> int:
     """Get port from environment"""
-    return int(os.environ.get('PORT', 8080))
+    return get_environment().port
 
 
+@functools.lru_cache(maxsize=None)
 def get_host() -> str:
     """Get host for web server"""
     return '0.0.0.0' if detect_platform() != 'local' else '127.0.0.1'
@@ -121,97 +259,126 @@ def get_host() -> str:
 class WebServerManager:
     """Manages the web server lifecycle"""
 
+    # Fixed reply for platform port probes when the dashboard cannot start
+    FALLBACK_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nOK"
+
     def __init__(self):
-        self.web_thread: Optional[threading.Thread] = None
+        self.server = None
+        self.server_task: Optional[asyncio.Task] = None
+        self.fallback_server: Optional[asyncio.AbstractServer] = None
         self.is_running = False
         self.platform = detect_platform()
         self.port = get_port()
         self.host = get_host()
-        self.logger = logging.getLogger(__name__)
 
     async def start_web_server(self, bot) -> bool:
-        """Start web server in background thread"""
+        """Start web server as a task on the running event loop"""
         try:
-            self.logger.info(f"🌐 Starting web server on {self.platform}")
-            self.logger.info(f"📍 Address: http://{self.host}:{self.port}")
+            logger.info("🌐 Starting web server on %s", self.platform)
+            logger.info("📍 Address: http://%s:%s", self.host, self.port)
 
-            def run_web_server():
-                """Web server thread function"""
-                try:
-                    # Import after paths are set
-                    from web.app import run_web_server
-
-                    self.logger.info("🚀 Web server thread starting...")
-
-                    # Run the web server
-                    run_web_server(
-                        bot=bot,
-                        host=self.host,
-                        port=self.port,
-                        debug=False  # Never debug in threaded mode
-                    )
-
-                except Exception as e:
-                    self.logger.error(f"❌ Web server thread error: {e}")
-                    import traceback
-                    self.logger.error(f"Traceback: {traceback.format_exc()}")
-                finally:
-                    self.is_running = False
-                    self.logger.info("🛑 Web server thread stopped")
-
-            # Create and start web server thread
-            self.web_thread = threading.Thread(
-                target=run_web_server,
-                name="WebServerThread",
-                daemon=True
-            )
+            # Import after paths are set
+            from web.app import create_asgi_server
 
-            self.web_thread.start()
+            self.server = create_asgi_server(bot=bot, host=self.host, port=self.port)
+            self.server_task = asyncio.create_task(self.server.serve(), name="web")
             self.is_running = True
 
-            # Give web server time to start
-            await asyncio.sleep(3)
+            # Wait until the socket is listening (or the server exits) - up to 5s
+            ready_task = asyncio.create_task(self.server.ready.wait())
+            await asyncio.wait({ready_task, self.server_task}, timeout=5, return_when=asyncio.FIRST_COMPLETED)
+            ready_task.cancel()
 
             # Verify web server started
-            if self.web_thread.is_alive():
-                self.logger.info("✅ Web server started successfully")
+            if self.server.started:
+                logger.info("✅ Web server started successfully")
 
                 # Log platform-specific URLs
                 if self.platform == 'render':
-                    render_url = os.getenv('RENDER_EXTERNAL_URL')
+                    render_url = get_environment().render_url
                     if render_url:
-                        self.logger.info(f"🔗 Render URL: {render_url}")
+                        logger.info("🔗 Render URL: %s", render_url)
                 elif self.platform == 'railway':
-                    self.logger.info("🚂 Railway deployment detected")
+                    logger.info("🚂 Railway deployment detected")
                 elif self.platform == 'local':
-                    self.logger.info(f"💻 Local dashboard: http://localhost:{self.port}")
+                    logger.info("💻 Local dashboard: http://localhost:%s", self.port)
 
                 return True
             else:
-                self.logger.error("❌ Web server failed to start")
+                self.is_running = False
+                logger.error("❌ Web server failed to start")
+                await self._abandon_server()
                 return False
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to start web server: {e}")
+            logger.error("❌ Failed to start web server: %s", e)
+            await self._abandon_server()
+            return False
+
+    async def _abandon_server(self):
+        """Stop a half-started dashboard so it can't still grab the port after we give up on it"""
+        if self.server is not None:
+            self.server.should_exit = True
+        if self.server_task is not None and not self.server_task.done():
+            self.server_task.cancel()
+            await asyncio.gather(self.server_task, return_exceptions=True)
+        self.is_running = False
+
+    async def start_fallback_server(self) -> bool:
+        """Keep the port answering with a bare 200 when the dashboard is unavailable"""
+
+        async def respond(reader, writer):
+            try:
+                # Read the request so closing doesn't reset the connection
+                await asyncio.wait_for(reader.read(1024), timeout=5)
+                writer.write(self.FALLBACK_RESPONSE)
+                await writer.drain()
+            except (asyncio.TimeoutError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        try:
+            self.fallback_server = await asyncio.start_server(respond, self.host, self.port, backlog=128)
+            logger.info("🩺 Fallback health responder listening on %s:%s", self.host, self.port)
+            return True
+        except OSError as e:
+            # Port still taken or address unusable: run the bot without a health responder
+            logger.error("❌ Fallback health responder failed, continuing without it: %s", e)
             return False
 
-    def stop_web_server(self):
+    def attach_bot(self, bot):
+        """Give a server that is already listening the bot it should report on"""
+        if self.server is not None:
+            self.server.web_manager.attach_bot(bot)
+
+    async def stop_web_server(self):
         """Stop web server gracefully"""
         try:
-            if self.web_thread and self.web_thread.is_alive():
-                self.logger.info("🛑 Stopping web server...")
-                self.is_running = False
+            if self.server_task and not self.server_task.done():
+                logger.info("🛑 Stopping web server...")
+                self.server.should_exit = True
+
+                # Wait for the server to drain (with timeout)
+                try:
+                    await asyncio.wait_for(self.server_task, timeout=5)
+                    logger.info("✅ Web server stopped")
+                except asyncio.TimeoutError:
+                    logger.warning("⚠️  Web server did not stop gracefully")
 
-                # Wait for thread to finish (with timeout)
-                self.web_thread.join(timeout=5)
+            # Views still blocked on the bot loop finish on their own; don't hold shutdown for them
+            if self.server is not None and self.server.wsgi_executor is not None:
+                self.server.wsgi_executor.shutdown(wait=False)
 
-                if self.web_thread.is_alive():
-                    self.logger.warning("⚠️  Web server thread did not stop gracefully")
-                else:
-                    self.logger.info("✅ Web server stopped")
+            if self.fallback_server is not None:
+                self.fallback_server.close()
+                await self.fallback_server.wait_closed()
+                self.fallback_server = None
+
+            self.is_running = False
 
         except Exception as e:
-            self.logger.error(f"Error stopping web server: {e}")
+            logger.error("Error stopping web server: %s", e)
 
 
 # ===== BOT MANAGEMENT =====
@@ -221,55 +388,50 @@ class BotManager:
     def __init__(self):
         self.bot = None
         self.web_manager = WebServerManager()
-        self.logger = logging.getLogger(__name__)
-        self.shutdown_requested = False
-
-        # Setup signal handlers
-        self._setup_signal_handlers()
+        self.shutdown_event: Optional[asyncio.Event] = None
 
-    def _setup_signal_handlers(self):
-        """Setup graceful shutdown signal handlers"""
+    def _install_signal_handlers(self):
+        """Route shutdown signals to the shutdown event on the running loop"""
+        import signal
+        loop = asyncio.get_running_loop()
 
-        def signal_handler(signum, frame):
-            self.logger.info(f"📡 Received signal {signum}")
-            self.shutdown_requested = True
-
-            # Trigger graceful shutdown
-            if hasattr(self, 'shutdown_event'):
-                self.shutdown_event.set()
-
-        # Register signal handlers
         if sys.platform != 'win32':
-            signal.signal(signal.SIGTERM, signal_handler)
-            signal.signal(signal.SIGINT, signal_handler)
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(sig, self._request_shutdown, sig)
         else:
-            signal.signal(signal.SIGINT, signal_handler)
+            # Windows has no loop signal support; hop onto the loop from the handler
+            signal.signal(
+                signal.SIGINT,
+                lambda signum, frame: loop.call_soon_threadsafe(self._request_shutdown, signum)
+            )
 
-        # Register cleanup function
-        atexit.register(self.cleanup)
+    def _request_shutdown(self, signum):
+        """Trigger graceful shutdown"""
+        logger.info("📡 Received signal %s", signum)
+        self.shutdown_event.set()
 
     async def initialize_bot(self) -> bool:
         """Initialize the Discord bot"""
         try:
-            self.logger.info("🤖 Initializing Discord bot...")
+            logger.info("🤖 Initializing Discord bot...")
 
-            # Import bot class
-            from bot.ladbot import LadBot
+            # Import bot class on a worker thread so the event loop stays responsive
+            loop = asyncio.get_running_loop()
+            ladbot_module = await loop.run_in_executor(None, importlib.import_module, 'bot.ladbot')
 
             # Create bot instance
-            self.bot = LadBot()
+            self.bot = ladbot_module.LadBot()
 
             # Configure bot for web integration
             self.bot.web_port = self.web_manager.port
             self.bot.web_host = self.web_manager.host
+            self.web_manager.attach_bot(self.bot)
 
-            self.logger.info("✅ Bot initialized successfully")
+            logger.info("✅ Bot initialized successfully")
             return True
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to initialize bot: {e}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Failed to initialize bot: %s", e)
             return False
 
     async def start_services(self) -> bool:
@@ -277,20 +439,21 @@ class BotManager:
         try:
             # Start web server if on deployment platform
             if self.web_manager.platform in ['render', 'railway', 'heroku']:
-                self.logger.info("🌐 Starting web server for platform deployment...")
+                logger.info("🌐 Starting web server for platform deployment...")
                 web_started = await self.web_manager.start_web_server(self.bot)
 
                 if not web_started:
-                    self.logger.warning("⚠️  Web server failed to start, continuing with bot only")
+                    logger.warning("⚠️  Web server failed to start, continuing with bot only")
+                    await self.web_manager.start_fallback_server()
             else:
-                self.logger.info("💻 Local development mode - web server optional")
+                logger.info("💻 Local development mode - web server optional")
                 # In local mode, you can still start web server
                 await self.web_manager.start_web_server(self.bot)
 
             return True
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to start services: {e}")
+            logger.error("❌ Failed to start services: %s", e)
             return False
 
     async def run_bot(self):
@@ -299,12 +462,13 @@ class BotManager:
             # Import settings
             from config.settings import settings
 
-            self.logger.info("🚀 Starting Discord bot...")
-            self.logger.info(f"📝 Prefix: {settings.BOT_PREFIX}")
-            self.logger.info(f"👥 Admins: {len(settings.ADMIN_IDS)} configured")
+            logger.info("🚀 Starting Discord bot...")
+            logger.info("📝 Prefix: %s", settings.BOT_PREFIX)
+            logger.info("👥 Admins: %s configured", len(settings.ADMIN_IDS))
 
-            # Create shutdown event
+            # Create shutdown event and route signals to it
             self.shutdown_event = asyncio.Event()
+            self._install_signal_handlers()
 
             # Start the bot
             async with self.bot:
@@ -333,47 +497,55 @@ class BotManager:
                     try:
                         await bot_task
                     except Exception as e:
-                        self.logger.error(f"❌ Bot task failed: {e}")
+                        logger.error("❌ Bot task failed: %s", e)
                         raise
 
-                self.logger.info("🛑 Bot shutdown initiated")
+                logger.info("🛑 Bot shutdown initiated")
 
         except Exception as e:
-            self.logger.error(f"❌ Bot run error: {e}")
+            logger.error("❌ Bot run error: %s", e)
             raise
 
-    def cleanup(self):
+    async def cleanup(self):
         """Cleanup resources"""
         try:
-            self.logger.info("🧹 Cleaning up resources...")
+            logger.info("🧹 Cleaning up resources...")
 
             # Stop web server
-            self.web_manager.stop_web_server()
+            await self.web_manager.stop_web_server()
 
             # Additional cleanup can be added here
 
-            self.logger.info("✅ Cleanup completed")
+            logger.info("✅ Cleanup completed")
 
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
 
 # ===== MAIN APPLICATION =====
 async def main():
     """Main application entry point with comprehensive error handling"""
-    start_time = datetime.now()
-    logger = None
+    start_ns = time.monotonic_ns()
+    logging_ready = False
+    bot_manager = None
+
+    # Start tasks eagerly so coroutines that finish without suspending skip the ready queue (3.12+)
+    if hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
 
     try:
         # ===== INITIALIZATION =====
         print("🚀 Starting Ladbot Enhanced...")
-        print(f"📅 Started at: {start_time}")
+        print(f"📅 Started at: {datetime.now()}")
         print(f"🐍 Python: {sys.version}")
         print(f"📁 Working directory: {PROJECT_ROOT}")
 
         # Setup logging first
         logging_ok = setup_logging()
-        logger = logging.getLogger(__name__)
+        logging_ready = True
+
+        # Warm up discord.py while the rest of startup runs
+        preload_modules()
 
         if not logging_ok:
             logger.warning("⚠️  Logging setup had issues, continuing with basic logging")
@@ -382,24 +554,20 @@ async def main():
         logger.info("🔍 Validating environment...")
 
         # Load environment variables
-        try:
-            from dotenv import load_dotenv
-            if (PROJECT_ROOT / ".env").exists():
-                load_dotenv(PROJECT_ROOT / ".env")
-                logger.info("✅ Environment variables loaded from .env")
-            else:
-                logger.info("ℹ️  No .env file found, using system environment")
-        except ImportError:
-            logger.info("ℹ️  python-dotenv not installed, using system environment")
+        if ENV_FILE.exists():
+            load_env_file(ENV_FILE)
+            logger.info("✅ Environment variables loaded from .env")
+        else:
+            logger.info("ℹ️  No .env file found, using system environment")
 
         # Validate configuration
         try:
             from config.settings import settings
             logger.info("✅ Configuration validated")
-            logger.info(f"🌍 Environment: {'PRODUCTION' if settings.IS_PRODUCTION else 'DEVELOPMENT'}")
-            logger.info(f"🔧 Debug mode: {settings.DEBUG}")
+            logger.info("🌍 Environment: %s", 'PRODUCTION' if settings.IS_PRODUCTION else 'DEVELOPMENT')
+            logger.info("🔧 Debug mode: %s", settings.DEBUG)
         except Exception as e:
-            logger.error(f"❌ Configuration validation failed: {e}")
+            logger.error("❌ Configuration validation failed: %s", e)
             return 1
 
         # ===== PLATFORM DETECTION =====
@@ -407,39 +575,43 @@ async def main():
         port = get_port()
         host = get_host()
 
-        logger.info(f"🏗️  Platform: {platform.title()}")
-        logger.info(f"🌐 Web server: {host}:{port}")
+        logger.info("🏗️  Platform: %s", platform.title())
+        logger.info("🌐 Web server: %s:%s", host, port)
 
         # Platform-specific logging
         if platform == 'render':
-            render_url = os.getenv('RENDER_EXTERNAL_URL')
-            logger.info(f"🔗 Render URL: {render_url or 'Not set'}")
+            render_url = get_environment().render_url
+            logger.info("🔗 Render URL: %s", render_url or 'Not set')
         elif platform == 'railway':
             logger.info("🚂 Railway deployment detected")
         elif platform == 'heroku':
-            app_name = os.getenv('HEROKU_APP_NAME')
-            logger.info(f"🟣 Heroku app: {app_name or 'Unknown'}")
+            app_name = get_environment().heroku_app_name
+            logger.info("🟣 Heroku app: %s", app_name or 'Unknown')
 
         # ===== BOT STARTUP =====
         logger.info("🤖 Starting bot services...")
 
         bot_manager = BotManager()
 
-        # Initialize bot
-        if not await bot_manager.initialize_bot():
-            logger.error("❌ Bot initialization failed")
-            return 1
+        # Import the bot in the background and bind the port meanwhile, so the
+        # platform's port scan sees a listener before discord.py has loaded
+        bot_init = asyncio.create_task(bot_manager.initialize_bot(), name="bot-init")
 
         # Start additional services
         if not await bot_manager.start_services():
+            bot_init.cancel()
             logger.error("❌ Service startup failed")
             return 1
 
+        # Initialize bot
+        if not await bot_init:
+            logger.error("❌ Bot initialization failed")
+            return 1
+
         # ===== MAIN BOT EXECUTION =====
         logger.info("🎮 Starting main bot execution...")
 
-        startup_time = datetime.now() - start_time
-        logger.info(f"⚡ Startup completed in {startup_time.total_seconds():.2f} seconds")
+        logger.info("⚡ Startup completed in %.2f seconds", (time.monotonic_ns() - start_ns) / 1e9)
 
         # Run the bot (this blocks until shutdown)
         await bot_manager.run_bot()
@@ -449,16 +621,15 @@ async def main():
         return 0
 
     except KeyboardInterrupt:
-        if logger:
+        if logging_ready:
             logger.info("⌨️  Keyboard interrupt received")
         else:
             print("\n⌨️  Keyboard interrupt received")
         return 0
 
     except Exception as e:
-        if logger:
-            logger.error(f"❌ Fatal error: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        if logging_ready:
+            logger.exception("❌ Fatal error: %s", e)
         else:
             print(f"❌ Fatal error: {e}")
             import traceback
@@ -466,9 +637,12 @@ async def main():
         return 1
 
     finally:
-        runtime = datetime.now() - start_time
-        if logger:
-            logger.info(f"⏱️  Total runtime: {runtime}")
+        if bot_manager:
+            await bot_manager.cleanup()
+
+        runtime = timedelta(seconds=(time.monotonic_ns() - start_ns) / 1e9)
+        if logging_ready:
+            logger.info("⏱️  Total runtime: %s", runtime)
             logger.info("👋 Goodbye!")
         else:
             print(f"⏱️  Total runtime: {runtime}")
@@ -477,6 +651,19 @@ async def main():
 
 # ===== UTILITY FUNCTIONS =====
 
+def preload_modules():
+    """Import discord.py and its C-extension dependencies on a background thread"""
+
+    def preload():
+        for module in ('zlib', 'aiohttp', 'discord', 'discord.ext.commands'):
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                pass
+
+    threading.Thread(target=preload, name="PreloadThread", daemon=True).start()
+
+
 def check_dependencies():
     """Check if all required dependencies are available"""
     required_modules = [
@@ -487,11 +674,10 @@ def check_dependencies():
         'psutil'
     ]
 
+    # Resolve module specs only; importing would execute each package's top level
     missing = []
     for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
+        if importlib.util.find_spec(module) is None:
             missing.append(module)
 
     if missing:
@@ -503,13 +689,16 @@ def check_dependencies():
 
 
 def create_required_directories():
-    """Create required directories"""
-    directories = [
-        PROJECT_ROOT / "logs",
-        PROJECT_ROOT / "data",
-        PROJECT_ROOT / "data" / "analytics",
-        PROJECT_ROOT / "data" / "guild_settings"
-    ]
+    """Create required directories that do not exist yet"""
+    # One directory listing instead of a stat+mkdir per path
+    try:
+        existing = {entry.name for entry in os.scandir(DATA_DIR) if entry.is_dir()}
+    except FileNotFoundError:
+        existing = set()
+
+    directories = [DATA_DIR / name for name in ("analytics", "guild_settings") if name not in existing]
+    if not LOGS_DIR.is_dir():
+        directories.append(LOGS_DIR)
 
     for directory in directories:
         try:
@@ -518,6 +707,43 @@ def create_required_directories():
             print(f"⚠️  Could not create directory {directory}: {e}")
 
 
+def load_env_file(path: Path):
+    """Load KEY=VALUE pairs from a .env file without overriding existing variables"""
+    content = path.read_text(encoding='utf-8')
+
+    # Variable interpolation needs the full python-dotenv parser
+    if '${' in content:
+        try:
+            from dotenv import load_dotenv
+            load_dotenv(path)
+            return
+        except ImportError:
+            pass
+
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        if line.startswith('export '):
+            line = line[len('export '):]
+
+        key, value = line.split('=', 1)
+        key = key.strip()
+        value = value.strip()
+
+        if value[:1] in ('"', "'"):
+            # Quoted value ends at the matching quote; anything after it (like "# comment") is dropped
+            end = value.find(value[0], 1)
+            if end != -1:
+                value = value[1:end]
+        else:
+            # Strip inline comments from unquoted values
+            value = value.split(' #', 1)[0].rstrip()
+
+        if key and key not in os.environ:
+            os.environ[key] = value
+
+
 def validate_environment():
     """Validate required environment variables"""
     required_vars = ['BOT_TOKEN']
@@ -535,6 +761,17 @@ def validate_environment():
     return True
 
 
+def run_event_loop(coro):
+    """Run a coroutine on uvloop when available, otherwise on the stdlib loop"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    return asyncio.run(coro)
+
+
 # ===== DEVELOPMENT HELPERS =====
 
 def development_mode():
@@ -556,7 +793,7 @@ def development_mode():
         # Run main application
         return await main()
 
-    return asyncio.run(dev_main())
+    return run_event_loop(dev_main())
 
 
 # ===== ENTRY POINT =====
@@ -571,7 +808,7 @@ if __name__ == "__main__":
             create_required_directories()
 
             # Run main application
-            exit_code = asyncio.run(main())
+            exit_code = run_event_loop(main())
 
         sys.exit(exit_code)
 
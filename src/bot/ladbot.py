@@ -6,25 +6,384 @@ real-time analytics, PostgreSQL database storage, and advanced error handling
 
 import asyncio
 import logging
+import math
 import threading
+import time
 import json
 import psutil
 import os
+import tempfile
+import zipfile
 import discord
 from pathlib import Path
 from utils.database import db_manager
 from datetime import datetime, date, timedelta
-from collections import defaultdict, deque
+from collections import Counter, deque
 from typing import Dict, Any, Optional, List, Union
 
 from discord.ext import commands, tasks
 
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Cached marker for a setting the guild has never stored
+_MISSING = object()
+
+# Admin/core commands that can't be disabled per guild
+_ALWAYS_ALLOWED = frozenset({'help', 'ping', 'settings', 'reload', 'logs', 'console', 'feedback'})
+
+# Static parts of the failure embeds; copied and given a description per use
+_DISABLED_EMBED = discord.Embed(title="🚫 Command Disabled", color=0xff9900).add_field(
+    name="Re-enable Command",
+    value="Use the web dashboard to enable this command",
+    inline=False
+)
+_ERROR_EMBED = discord.Embed(title="❌ Command Error", color=0xff0000)
+
+
+def _sample_process(process: psutil.Process):
+    """Memory RSS, memory percent and CPU percent of a process (runs on a worker thread)"""
+    with process.oneshot():
+        return process.memory_info().rss, process.memory_percent(), process.cpu_percent(None)
+
+
+def _discover_cog_modules(cogs_dir: str, package: str) -> List[str]:
+    """
+    Module names of the cogs under cogs_dir, found with a single scandir pass per directory
+
+    Cogs live in category packages (cogs/<category>/<cog>.py); a directory without
+    category packages is treated as the legacy flat layout (cogs/<cog>.py).
+    """
+    categories = []
+    flat_cogs = []
+    with os.scandir(cogs_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("_"):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if os.path.exists(os.path.join(entry.path, "__init__.py")):
+                    categories.append(entry)
+            elif entry.name.endswith(".py"):
+                flat_cogs.append(f"{package}.{entry.name[:-3]}")
+
+    if not categories:
+        logger.info("📂 Using legacy cog structure (flat directory)")
+        return sorted(flat_cogs)
+
+    logger.info("📂 Using new cog structure (subdirectories)")
+    modules = []
+    for category in categories:
+        with os.scandir(category.path) as entries:
+            modules.extend(
+                f"{package}.{category.name}.{entry.name[:-3]}"
+                for entry in entries
+                if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+            )
+    return sorted(modules)
+
+
+def _seconds_until_midnight() -> float:
+    """Seconds until the next local midnight"""
+    now = datetime.now()
+    return (datetime.combine(now.date() + timedelta(days=1), datetime.min.time()) - now).total_seconds()
+
+
+def _json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Encode data as JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_stats_records(snapshot_path: Path, log_path: Path) -> List[Dict[str, Any]]:
+    """Read a stats snapshot and the delta records logged after it, oldest first (runs on a worker thread)
+
+    A crash during an append can leave a partial last line in the log. It is cut off so the
+    next append starts on a fresh line, and any other line that doesn't decode is skipped.
+    """
+    records = []
+    if snapshot_path.exists():
+        with open(snapshot_path, 'rb') as f:
+            records.append(_json_loads(f.read()))
+    if log_path.exists():
+        with open(log_path, 'rb+') as f:
+            content = f.read()
+            if content and not content.endswith(b"\n"):
+                complete = content.rfind(b"\n") + 1
+                logger.warning("Truncating partial last line of %s", log_path)
+                f.truncate(complete)
+                content = content[:complete]
+
+        for number, line in enumerate(content.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                record = _json_loads(line)
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                records.append(record)
+            else:
+                logger.warning("Skipping unreadable record on line %d of %s", number, log_path)
+    return records
+
+
+def _append_line(path: Path, line: bytes):
+    """Append a line to a file (runs on a worker thread)"""
+    with open(path, 'ab') as f:
+        f.write(line)
+
+
+def _write_atomic(path: Path, content: bytes):
+    """Write a file through a temp file and rename, so readers never see it half-written
+
+    The temp name is unique, so two writers racing on the same path (a cancelled loop's
+    worker thread and the shutdown compaction) each publish a complete file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _replace_snapshot(snapshot_path: Path, log_path: Path, content: bytes):
+    """Atomically replace a snapshot, then drop the log it supersedes (runs on a worker thread)"""
+    _write_atomic(snapshot_path, content)
+    log_path.unlink(missing_ok=True)
+
+
+class _Activity:
+    """One reusable slot of the bot's recent activity ring"""
+    __slots__ = ('type', 'description', 'timestamp', 'guild_count', 'user_count')
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.type,
+            'description': self.description,
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat(),
+            'guild_count': self.guild_count,
+            'user_count': self.user_count
+        }
+
+
+class EnhancedDataManager:
+    """Analytics and backup storage (non-settings data)"""
+
+    def __init__(self, settings, bot_instance):
+        self.settings = settings
+        self.bot = bot_instance
+
+        # Force absolute path for Railway/production
+        if os.getenv('RAILWAY_ENVIRONMENT') or os.getenv('RENDER'):
+            self.data_dir = Path("/app/data")
+        else:
+            self.data_dir = Path("data")
+
+        self.data_dir.mkdir(exist_ok=True)
+
+        # Create subdirectories
+        (self.data_dir / "analytics").mkdir(exist_ok=True)
+        (self.data_dir / "backups").mkdir(exist_ok=True)
+
+        self.last_cache_clear = datetime.now()
+
+        logger.info(f"📊 Data manager initialized with path: {self.data_dir}")
+
+    def analytics_logs(self) -> List[str]:
+        """Paths of the daily analytics logs (one JSON record per line), oldest first"""
+        with os.scandir(self.data_dir / "analytics") as entries:
+            return sorted(
+                entry.path for entry in entries
+                if entry.name.startswith("bot_analytics_") and entry.name.endswith(".jsonl")
+            )
+
+    def save_analytics_data(self, data):
+        """Append an analytics record to today's log (blocking; the bot calls it on a worker thread)"""
+        try:
+            analytics_file = self.data_dir / "analytics" / f"bot_analytics_{date.today().strftime('%Y%m%d')}.jsonl"
+            _append_line(analytics_file, _json_bytes(data) + b"\n")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving analytics data: {e}")
+            return False
+
+    def get_analytics_data(self):
+        """Load the latest analytics record"""
+        try:
+            logs = self.analytics_logs()
+
+            if logs:
+                with open(logs[-1], 'rb') as f:
+                    last = deque(f, maxlen=1)
+                if last:
+                    return _json_loads(last[0])
+
+            return {}
+
+        except Exception as e:
+            logger.error(f"Error loading analytics data: {e}")
+            return {}
+
+    def prune_analytics(self, keep_days: int = 30):
+        """Delete all but the newest daily analytics logs (names sort by date)"""
+        try:
+            for path in self.analytics_logs()[:-keep_days]:
+                os.unlink(path)
+
+        except Exception as e:
+            logger.error(f"Error pruning analytics logs: {e}")
+
+    def backup_settings(self, command_usage: Dict[str, int]):
+        """Create a backup of all settings (blocking; the bot calls it on a worker thread).
+
+        command_usage is a copy taken on the event loop, so the worker never iterates live bot state.
+        """
+        try:
+            backup_dir = self.data_dir / "backups"
+            backup_file = backup_dir / f"settings_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+            analytics_logs = self.analytics_logs()
+
+            meta = {
+                'timestamp': datetime.now().isoformat(),
+                'command_usage': command_usage
+            }
+
+            # The latest analytics log is already JSON on disk; store its bytes as-is rather than parse and re-encode
+            with zipfile.ZipFile(backup_file, 'w', zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr('meta.json', _json_bytes(meta))
+                if analytics_logs:
+                    latest = analytics_logs[-1]
+                    archive.write(latest, arcname=f"analytics/{os.path.basename(latest)}")
+
+            logger.info(f"📦 Settings backup created: {backup_file}")
+            self.prune_backups()
+            return backup_file
+
+        except Exception as e:
+            logger.error(f"Error creating settings backup: {e}")
+            return None
+
+    def backup_and_replace_snapshot(self, command_usage: Dict[str, int], snapshot_path: Path, log_path: Path,
+                                    content: bytes):
+        """Write a settings backup and a stats snapshot from the same usage snapshot in one worker job"""
+        self.backup_settings(command_usage)
+        _replace_snapshot(snapshot_path, log_path, content)
+
+    def prune_backups(self, keep: int = 10):
+        """Delete all but the newest settings backups (names sort by timestamp; older ones are .json)"""
+        try:
+            with os.scandir(self.data_dir / "backups") as entries:
+                backups = sorted(
+                    entry.path for entry in entries
+                    if entry.name.startswith("settings_backup_") and entry.name.endswith((".zip", ".json"))
+                )
+
+            for path in backups[:-keep]:
+                os.unlink(path)
+
+        except Exception as e:
+            logger.error(f"Error pruning settings backups: {e}")
+
+    def clear_cache(self):
+        """Clear settings cache"""
+        self.bot.settings_cache.clear()
+        self.last_cache_clear = datetime.now()
+        logger.debug("🧹 Settings cache cleared")
+
+
+class ExtensionCogLoader:
+    """Cog loader facade over bot.extensions, for reload command compatibility"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._loaded_cogs_cache = set()
+
+    @property
+    def loaded_cogs(self):
+        """Get loaded cog names as a set"""
+        return set(self.bot.extensions.keys())
+
+    @loaded_cogs.setter
+    def loaded_cogs(self, value):
+        """Setter for compatibility"""
+        self._loaded_cogs_cache = set(value) if value else set()
+
+    def get_loaded_cogs(self):
+        """Get list of loaded cog names"""
+        return list(self.bot.extensions.keys())
+
+    def get_failed_cogs(self):
+        """Get list of failed cog names"""
+        return []  # Placeholder
+
+    async def reload_cog(self, cog_name):
+        """Reload a specific cog"""
+        try:
+            await self.bot.reload_extension(cog_name)
+            logger.info(f"✅ Reloaded cog: {cog_name}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error reloading cog {cog_name}: {e}")
+            return False
+
+    async def reload_all_cogs(self):
+        """Reload all loaded cogs"""
+        cogs_to_reload = list(self.loaded_cogs)
+        reloaded_count = 0
+        failed_count = 0
+
+        for cog_name in cogs_to_reload:
+            success = await self.reload_cog(cog_name)
+            if success:
+                reloaded_count += 1
+            else:
+                failed_count += 1
+
+        logger.info(f"🔄 Cog reload complete: {reloaded_count} reloaded, {failed_count} failed")
+        return reloaded_count, failed_count
+
+    def get_cog_status(self):
+        """Get overall cog status"""
+        return {
+            'loaded': len(self.bot.extensions),
+            'failed': 0,
+            'total': len(self.bot.extensions)
+        }
+
 
 class LadBot(commands.Bot):
     """Enhanced Ladbot with comprehensive web integration and database storage"""
 
+    # Seconds a setting read from the database is served from settings_cache
+    SETTINGS_CACHE_TTL = 30.0
+
+    # Number of recent activities kept for the dashboard
+    ACTIVITY_SLOTS = 100
+
+    # Minimum time between periodic settings backups
+    BACKUP_INTERVAL_NS = 6 * 3600 * 1_000_000_000
+
+    # Stats ticks (5 minutes each) between hourly cleanups
+    CLEANUP_EVERY_TICKS = 12
+
     def __init__(self):
         """Initialize the bot with enhanced tracking and web integration"""
         # Get settings
@@ -34,18 +393,21 @@ class LadBot(commands.Bot):
         # Compatibility aliases for existing cogs
         self.config = settings
 
-        # Set up Discord intents
-        intents = discord.Intents.default()
-        intents.message_content = True
+        # Set up Discord intents - only the events the bot and its cogs handle
+        intents = discord.Intents.none()
         intents.guilds = True
-        intents.members = True
-        intents.reactions = True
-        intents.voice_states = True
+        intents.guild_messages = True
+        intents.dm_messages = True  # Commands work in DMs
+        intents.message_content = True
+        intents.guild_reactions = True  # Reaction-driven games and confirmations
+        intents.dm_reactions = True  # ...which also run in DMs
+        intents.members = settings.ENABLE_MEMBER_INTENT
 
         # Initialize bot with settings
         super().__init__(
             command_prefix=settings.BOT_PREFIX,
             intents=intents,
+            chunk_guilds_at_startup=settings.ENABLE_MEMBER_INTENT,  # Member cache only fills with the intent
             help_command=None,
             case_insensitive=True,
             strip_after_prefix=True
@@ -60,22 +422,31 @@ class LadBot(commands.Bot):
         # ===== ANALYTICS & TRACKING =====
         self.start_time = None
         self.startup_time = datetime.now()
+        self._startup_ns = time.monotonic_ns()  # Uptime source, immune to wall-clock changes
 
         # Command tracking
-        self.command_usage = defaultdict(int)
+        self.command_usage: Counter = Counter()  # missing names read as 0 without being inserted
+        self._saved_usage: Dict[str, int] = {}  # command_usage as of the last stats write
+        self._stats_lock = asyncio.Lock()
+        self._command_stats_loaded = False
+        self._last_backup_ns = time.monotonic_ns()  # close() always writes a final backup
         self.commands_used_today = 0
         self.total_commands_used = 0
         self.session_commands = 0
         self.unique_commands_used = 0
         self.last_reset_date = date.today().isoformat()
+        self._next_reset_check = 0.0  # Monotonic time of the next daily-reset date check
         self.error_count = 0
 
         # Performance tracking
         self.latency_history = deque(maxlen=60)  # Last 60 measurements
+        self._latency_sum = 0.0  # Running sum of latency_history
         self.average_latency = 0
         self.last_latency_check = datetime.now()
 
         # Memory and system tracking
+        self._process = psutil.Process()
+        self._process.cpu_percent(None)  # Prime so the first sample covers a real interval
         self.memory_usage = 0
         self.cpu_usage = 0
         self.memory_percent = 0
@@ -83,25 +454,31 @@ class LadBot(commands.Bot):
         # Additional compatibility attributes for web dashboard
         self.loaded_cogs = 0
         self.total_tracked_commands = 0
+        self._member_count_total = 0  # Kept current by guild and member events
 
         # ===== DATABASE INTEGRATION =====
         self.db_manager = None
         self.database_ready = False
 
         # ===== DATA MANAGEMENT =====
-        self.data_manager = self._create_data_manager()  # Keep for analytics/backups
-        self.cog_loader = self._create_cog_loader()
+        self.data_manager = EnhancedDataManager(settings, self)  # Keep for analytics/backups
+        self.cog_loader = ExtensionCogLoader(self)
 
         # Settings cache for performance (now database-backed)
         self.settings_cache = {}
         self.guild_settings = {}  # Compatibility alias
 
-        # Recent activity tracking
-        self.recent_activity = deque(maxlen=100)
+        # Setting reads waiting on the next batched database query, by guild
+        self._pending_setting_reads: Dict[int, asyncio.Future] = {}
+        self._settings_flush_task: Optional[asyncio.Task] = None
 
-        # Background tasks
+        # Recent activity tracking: preallocated slots reused in place
+        self._activity_ring = [_Activity() for _ in range(self.ACTIVITY_SLOTS)]
+        self._activity_head = 0  # Activities recorded so far; the next slot is head % ACTIVITY_SLOTS
+
+        # Background tasks (one timer; hourly cleanup rides on the stats loop)
         self.update_stats_task = self.update_stats_loop
-        self.cleanup_task = self.cleanup_loop
+        self._shutdown_task: Optional[asyncio.Task] = None
 
         logger.info("🔧 Enhanced Ladbot initialized with database integration")
 
@@ -135,91 +512,99 @@ class LadBot(commands.Bot):
 
     async def on_command(self, ctx):
         """Global command interceptor - checks database settings for ALL commands"""
+        command_name = ctx.command.name
+        if command_name in _ALWAYS_ALLOWED:
+            return  # Admin/core commands always work
+
         if not ctx.guild:
-            logger.debug(f"🔍 COMMAND CHECK: {ctx.command.name} - No guild context, allowing")
+            logger.debug(f"🔍 COMMAND CHECK: {command_name} - No guild context, allowing")
             return  # Allow DM commands
 
         if not self.database_ready:
-            logger.warning(f"🔍 COMMAND CHECK: {ctx.command.name} - Database not ready, allowing")
+            logger.warning(f"🔍 COMMAND CHECK: {command_name} - Database not ready, allowing")
             return  # Allow commands if database not ready
 
         try:
-            # Get the command name
-            command_name = ctx.command.name
             guild_id = ctx.guild.id
 
-            logger.info(f"🔍 COMMAND CHECK: Checking {command_name} for guild {guild_id}")
-
-            # Special commands that should always work (admin/core commands)
-            always_allowed = {'help', 'ping', 'settings', 'reload', 'logs', 'console', 'feedback'}
-
-            if command_name in always_allowed:
-                logger.debug(f"🔍 COMMAND CHECK: {command_name} is always allowed")
-                return  # Allow these commands always
-
-            # Check if command is enabled in database - ADD DETAILED LOGGING
-            logger.info(f"🔍 COMMAND CHECK: Querying database for {command_name} in guild {guild_id}")
+            # Check if command is enabled (usually a settings_cache hit)
             setting_enabled = await self.get_setting(guild_id, command_name, True)
-            logger.info(f"🔍 COMMAND CHECK: Database returned {setting_enabled} for {command_name} in guild {guild_id}")
+            logger.debug(f"🔍 COMMAND CHECK: {command_name} enabled={setting_enabled} in guild {guild_id}")
 
             if not setting_enabled:
                 # Command is disabled - show message and raise an exception
                 logger.info(f"🚫 BLOCKING COMMAND: {command_name} is disabled for guild {guild_id}")
 
-                embed = discord.Embed(
-                    title="🚫 Command Disabled",
-                    description=f"The `{command_name}` command has been disabled for this server.",
-                    color=0xff9900
-                )
-                embed.add_field(
-                    name="Re-enable Command",
-                    value="Use the web dashboard to enable this command",
-                    inline=False
-                )
+                embed = _DISABLED_EMBED.copy()
+                embed.description = f"The `{command_name}` command has been disabled for this server."
                 await ctx.send(embed=embed)
 
                 # Raise an exception instead of disabling globally
-                from discord.ext.commands import CheckFailure
-                raise CheckFailure(f"Command {command_name} is disabled for this server")
-
-            logger.info(f"✅ ALLOWING COMMAND: {command_name} is enabled for guild {guild_id}")
+                raise commands.CheckFailure(f"Command {command_name} is disabled for this server")
 
-        except CheckFailure:
+        except commands.CheckFailure:
             # Re-raise CheckFailure exceptions
             raise
         except Exception as e:
-            logger.error(f"❌ Error in global command check for {command_name}: {e}")
-            logger.error(f"❌ Full traceback: {traceback.format_exc()}")
+            logger.exception("❌ Error in global command check for %s: %s", command_name, e)
             # On error, allow command (fail-safe)
 
     # ===== SETTINGS METHODS - DATABASE INTEGRATION =====
 
     async def get_setting(self, guild_id: int, setting_name: str, default=True):
-        """Get a guild setting from database - FIXED VERSION WITH LOGGING"""
+        """Get a guild setting, batching database reads made in the same loop tick"""
         if not self.database_ready or not self.db_manager:
             logger.warning(f"🔍 GET_SETTING: Database not ready, returning default {default} for {setting_name}")
             return default
 
-        try:
-            logger.debug(f"🔍 GET_SETTING: Querying database for {setting_name} in guild {guild_id}")
-
-            # Force database lookup every time for web dashboard changes
-            value = await self.db_manager.get_guild_setting(guild_id, setting_name, default)
+        cache_key = (guild_id, setting_name)
+        cached = self.settings_cache.get(cache_key)
+        if cached is not None and cached[1] > time.monotonic():
+            value = cached[0]
+            return default if value is _MISSING else value
 
-            logger.info(f"🔍 GET_SETTING: Database returned {setting_name}={value} for guild {guild_id}")
-            return value
+        try:
+            future = self._pending_setting_reads.get(guild_id)
+            if future is None:
+                first_read = not self._pending_setting_reads
+                future = asyncio.get_running_loop().create_future()
+                self._pending_setting_reads[guild_id] = future
+                if first_read:
+                    # First read this tick: query once everything queued so far has run
+                    self._settings_flush_task = asyncio.create_task(self._flush_setting_reads())
+
+            # Shielded so a cancelled command doesn't fail every read sharing the query
+            guild_settings = await asyncio.shield(future)
         except Exception as e:
             logger.error(f"❌ GET_SETTING: Error getting setting {setting_name} for guild {guild_id}: {e}")
             return default
 
+        value = guild_settings.get(setting_name, _MISSING)
+        self.settings_cache[cache_key] = (value, time.monotonic() + self.SETTINGS_CACHE_TTL)
+
+        logger.debug(f"🔍 GET_SETTING: Database returned {setting_name}={value} for guild {guild_id}")
+        return default if value is _MISSING else value
+
+    async def _flush_setting_reads(self):
+        """Resolve every pending setting read with a single database query"""
+        # Yield first: with an eager task factory this would otherwise run before the tick's reads queue up
+        await asyncio.sleep(0)
+        pending, self._pending_setting_reads = self._pending_setting_reads, {}
+
         try:
-            # Force database lookup every time for web dashboard changes
-            value = await self.db_manager.get_guild_setting(guild_id, setting_name, default)
-            logger.debug(f"🔍 BOT: Got {setting_name}={value} for guild {guild_id} from database")
-            return value
+            settings = await self.db_manager.get_settings_for_guilds(list(pending))
+            if settings is None:
+                raise RuntimeError("batched settings query failed")
         except Exception as e:
-            logger.error(f"❌ BOT: Error getting setting {setting_name}: {e}")
-            return default
+            # Failed reads fall back to the default uncached, so the next check retries the database
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for guild_id, future in pending.items():
+            if not future.done():
+                future.set_result(settings.get(guild_id, {}))
 
     async def set_setting(self, guild_id: int, setting_name: str, value):
         """Set a guild setting in database - FIXED VERSION"""
@@ -230,9 +615,8 @@ class LadBot(commands.Bot):
         try:
             success = await self.db_manager.set_guild_setting(guild_id, setting_name, value)
             if success:
-                # Clear any local cache
-                cache_key = f"{guild_id}_{setting_name}"
-                self.settings_cache.pop(cache_key, None)
+                # Write through so the next read doesn't go back to the database
+                self.settings_cache[(guild_id, setting_name)] = (value, time.monotonic() + self.SETTINGS_CACHE_TTL)
                 logger.info(f"✅ BOT: Set {setting_name}={value} for guild {guild_id} in database")
             return success
         except Exception as e:
@@ -251,12 +635,13 @@ class LadBot(commands.Bot):
             return {}
 
     def reload_guild_settings(self, guild_id: int):
-        """Clear settings cache for a guild (database is always current)"""
+        """Clear settings cache for a guild so the next reads come from the database"""
         try:
-            # Clear cache for this guild
-            keys_to_remove = [k for k in self.settings_cache.keys() if k.startswith(f"{guild_id}_")]
+            # Clear cached setting reads for this guild, plus any per-guild dict cogs keep here
+            keys_to_remove = [k for k in self.settings_cache if type(k) is tuple and k[0] == guild_id]
             for key in keys_to_remove:
                 del self.settings_cache[key]
+            self.settings_cache.pop(guild_id, None)
 
             logger.info(f"🔄 Cleared settings cache for guild {guild_id}")
             return True
@@ -266,24 +651,35 @@ class LadBot(commands.Bot):
 
     # ===== COMPATIBILITY METHODS =====
 
+    @staticmethod
+    def _ensure_off_loop():
+        """The sync wrappers wait on the bot's loop, so calling them from it would deadlock"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise RuntimeError("Sync setting wrappers can't run on the event loop; await get_setting/set_setting instead")
+
     def get_guild_setting(self, guild_id: int, setting_name: str, default=True):
-        """Sync wrapper for get_setting (for compatibility with sync code)"""
+        """Sync wrapper for get_setting, for worker threads such as the web dashboard"""
         if not self.database_ready:
             return default
+        self._ensure_off_loop()
         try:
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(self.get_setting(guild_id, setting_name, default))
+            future = asyncio.run_coroutine_threadsafe(self.get_setting(guild_id, setting_name, default), self.loop)
+            return future.result(timeout=5)
         except Exception as e:
             logger.error(f"Error in sync get_guild_setting: {e}")
             return default
 
     def set_guild_setting(self, guild_id: int, setting_name: str, value):
-        """Sync wrapper for set_setting (for compatibility with sync code)"""
+        """Sync wrapper for set_setting, for worker threads such as the web dashboard"""
         if not self.database_ready:
             return False
+        self._ensure_off_loop()
         try:
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(self.set_setting(guild_id, setting_name, value))
+            future = asyncio.run_coroutine_threadsafe(self.set_setting(guild_id, setting_name, value), self.loop)
+            return future.result(timeout=5)
         except Exception as e:
             logger.error(f"Error in sync set_guild_setting: {e}")
             return False
@@ -293,224 +689,61 @@ class LadBot(commands.Bot):
         """Bot prefix for compatibility"""
         return self.command_prefix
 
-    # ===== DATA MANAGEMENT =====
-
-    def _create_data_manager(self):
-        """Create a data manager for analytics and backups (non-settings data)"""
+    @property
+    def guild_count(self) -> int:
+        """Number of cached guilds"""
+        return len(self.guilds)
 
-        class EnhancedDataManager:
-            def __init__(self, settings, bot_instance):
-                self.settings = settings
-                self.bot = bot_instance
+    @property
+    def user_count(self) -> int:
+        """Number of cached users"""
+        return len(self.users)
 
-                # Force absolute path for Railway/production
-                if os.getenv('RAILWAY_ENVIRONMENT') or os.getenv('RENDER'):
-                    self.data_dir = Path("/app/data")
-                else:
-                    self.data_dir = Path("data")
-
-                self.data_dir.mkdir(exist_ok=True)
-
-                # Create subdirectories
-                (self.data_dir / "analytics").mkdir(exist_ok=True)
-                (self.data_dir / "backups").mkdir(exist_ok=True)
-
-                self.last_cache_clear = datetime.now()
-
-                logger.info(f"📊 Data manager initialized with path: {self.data_dir}")
-
-            def save_analytics_data(self, data):
-                """Save analytics data to file"""
-                try:
-                    analytics_file = self.data_dir / "analytics" / "bot_analytics.json"
-                    with open(analytics_file, 'w') as f:
-                        json.dump(data, f, indent=2)
-                    return True
-                except Exception as e:
-                    logger.error(f"Error saving analytics data: {e}")
-                    return False
-
-            def get_analytics_data(self):
-                """Load analytics data from file"""
-                try:
-                    analytics_file = self.data_dir / "analytics" / "bot_analytics.json"
-
-                    if analytics_file.exists():
-                        with open(analytics_file, 'r') as f:
-                            return json.load(f)
-
-                    return {}
-
-                except Exception as e:
-                    logger.error(f"Error loading analytics data: {e}")
-                    return {}
-
-            def backup_settings(self):
-                """Create a backup of all settings"""
-                try:
-                    backup_dir = self.data_dir / "backups"
-                    backup_file = backup_dir / f"settings_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-
-                    backup_data = {
-                        'timestamp': datetime.now().isoformat(),
-                        'analytics': self.get_analytics_data(),
-                        'command_usage': dict(self.bot.command_usage)
-                    }
-
-                    with open(backup_file, 'w') as f:
-                        json.dump(backup_data, f, indent=2)
-
-                    logger.info(f"📦 Settings backup created: {backup_file}")
-                    return backup_file
-
-                except Exception as e:
-                    logger.error(f"Error creating settings backup: {e}")
-                    return None
-
-            def clear_cache(self):
-                """Clear settings cache"""
-                self.bot.settings_cache.clear()
-                self.last_cache_clear = datetime.now()
-                logger.debug("🧹 Settings cache cleared")
-
-        return EnhancedDataManager(self.settings, self)
-
-    def _create_cog_loader(self):
-        """Create a cog loader for reload command compatibility"""
-
-        class CogLoader:
-            def __init__(self, bot):
-                self.bot = bot
-                self._loaded_cogs_cache = set()
-
-            @property
-            def loaded_cogs(self):
-                """Get loaded cog names as a set"""
-                return set(self.bot.extensions.keys())
-
-            @loaded_cogs.setter
-            def loaded_cogs(self, value):
-                """Setter for compatibility"""
-                self._loaded_cogs_cache = set(value) if value else set()
-
-            def get_loaded_cogs(self):
-                """Get list of loaded cog names"""
-                return list(self.bot.extensions.keys())
-
-            def get_failed_cogs(self):
-                """Get list of failed cog names"""
-                return []  # Placeholder
-
-            async def reload_cog(self, cog_name):
-                """Reload a specific cog"""
-                try:
-                    await self.bot.reload_extension(cog_name)
-                    logger.info(f"✅ Reloaded cog: {cog_name}")
-                    return True
-                except Exception as e:
-                    logger.error(f"❌ Error reloading cog {cog_name}: {e}")
-                    return False
-
-            async def reload_all_cogs(self):
-                """Reload all loaded cogs"""
-                cogs_to_reload = list(self.loaded_cogs)
-                reloaded_count = 0
-                failed_count = 0
-
-                for cog_name in cogs_to_reload:
-                    success = await self.reload_cog(cog_name)
-                    if success:
-                        reloaded_count += 1
-                    else:
-                        failed_count += 1
-
-                logger.info(f"🔄 Cog reload complete: {reloaded_count} reloaded, {failed_count} failed")
-                return reloaded_count, failed_count
-
-            def get_cog_status(self):
-                """Get overall cog status"""
-                return {
-                    'loaded': len(self.bot.extensions),
-                    'failed': 0,
-                    'total': len(self.bot.extensions)
-                }
+    @property
+    def uptime_seconds(self) -> int:
+        """Whole seconds since the bot object was created, from the monotonic clock"""
+        return (time.monotonic_ns() - self._startup_ns) // 1_000_000_000
 
-        return CogLoader(self)
+    @property
+    def member_count(self) -> int:
+        """Members across all guilds, maintained by gateway events instead of summed per read"""
+        return self._member_count_total
 
     # ===== COG LOADING - ENHANCED =====
 
     async def load_all_cogs(self):
         """Load all cogs with comprehensive error handling and multiple directory support"""
-        # Try multiple possible cog directory locations
+        # Try multiple possible cog directory locations, with the package each maps to
         possible_dirs = [
-            Path("src/cogs"),  # New structure in src
-            Path("cogs"),  # Standard structure
-            Path("Cogs")  # Legacy structure
+            ("src/cogs", "src.cogs"),  # New structure in src
+            ("cogs", "cogs"),  # Standard structure
+            ("Cogs", "Cogs")  # Legacy structure
         ]
 
-        cogs_dir = None
-        for dir_path in possible_dirs:
-            if dir_path.exists():
-                cogs_dir = dir_path
+        cogs_dir = package = None
+        for dir_path, dir_package in possible_dirs:
+            if os.path.isdir(dir_path):
+                cogs_dir, package = dir_path, dir_package
                 logger.info(f"📁 Found cogs directory: {cogs_dir}")
                 break
 
         if not cogs_dir:
-            logger.error(f"❌ No cogs directory found! Searched: {[str(p) for p in possible_dirs]}")
+            logger.error(f"❌ No cogs directory found! Searched: {[p for p, _ in possible_dirs]}")
             return
 
         loaded = 0
         failed = 0
         failed_cogs = []
 
-        # Check for new structure (subdirectories)
-        if any(item.is_dir() and not item.name.startswith("_") for item in cogs_dir.iterdir()):
-            # New structure: cogs organized in subdirectories
-            logger.info("📂 Using new cog structure (subdirectories)")
-            for category_dir in cogs_dir.iterdir():
-                if category_dir.is_dir() and not category_dir.name.startswith("_"):
-                    for cog_file in category_dir.glob("*.py"):
-                        if cog_file.name.startswith("_"):
-                            continue
-
-                        # Determine import path based on directory structure
-                        if cogs_dir.name == "cogs" and cogs_dir.parent.name == "src":
-                            cog_name = f"src.cogs.{category_dir.name}.{cog_file.stem}"
-                        else:
-                            cog_name = f"cogs.{category_dir.name}.{cog_file.stem}"
-
-                        try:
-                            await self.load_extension(cog_name)
-                            logger.info(f"✅ Loaded: {cog_name}")
-                            loaded += 1
-                        except Exception as e:
-                            logger.error(f"❌ Failed to load {cog_name}: {e}")
-                            failed += 1
-                            failed_cogs.append((cog_name, str(e)))
-
-        else:
-            # Old structure: all cogs in one directory
-            logger.info("📂 Using legacy cog structure (flat directory)")
-            for cog_file in cogs_dir.glob("*.py"):
-                if cog_file.name.startswith("_"):
-                    continue
-
-                # Determine import path
-                if cogs_dir.name == "Cogs":
-                    cog_name = f"Cogs.{cog_file.stem}"
-                elif cogs_dir.name == "cogs" and cogs_dir.parent.name == "src":
-                    cog_name = f"src.cogs.{cog_file.stem}"
-                else:
-                    cog_name = f"cogs.{cog_file.stem}"
-
-                try:
-                    await self.load_extension(cog_name)
-                    logger.info(f"✅ Loaded: {cog_name}")
-                    loaded += 1
-                except Exception as e:
-                    logger.error(f"❌ Failed to load {cog_name}: {e}")
-                    failed += 1
-                    failed_cogs.append((cog_name, str(e)))
+        for cog_name in _discover_cog_modules(cogs_dir, package):
+            try:
+                await self.load_extension(cog_name)
+                logger.info(f"✅ Loaded: {cog_name}")
+                loaded += 1
+            except Exception as e:
+                logger.error(f"❌ Failed to load {cog_name}: {e}")
+                failed += 1
+                failed_cogs.append((cog_name, str(e)))
 
         self.loaded_cogs = loaded
         logger.info(f"🎮 Cog loading complete: {loaded} loaded, {failed} failed")
@@ -528,9 +761,6 @@ class LadBot(commands.Bot):
             if not self.update_stats_task.is_running():
                 self.update_stats_task.start()
 
-            if not self.cleanup_task.is_running():
-                self.cleanup_task.start()
-
             logger.info("📊 Background tasks started")
 
         except Exception as e:
@@ -540,34 +770,53 @@ class LadBot(commands.Bot):
 
     def add_activity(self, activity_type: str, description: str):
         """Add an activity to recent activity tracking"""
-        self.recent_activity.append({
-            'type': activity_type,
-            'description': description,
-            'timestamp': datetime.now().isoformat(),
-            'guild_count': len(self.guilds),
-            'user_count': len(self.users)
-        })
+        slot = self._activity_ring[self._activity_head % self.ACTIVITY_SLOTS]
+        slot.type = activity_type
+        slot.description = description
+        slot.timestamp = time.time()
+        slot.guild_count = self.guild_count
+        slot.user_count = self.user_count
+        self._activity_head += 1
+
+    def get_recent_activity(self, limit: int = ACTIVITY_SLOTS) -> List[Dict[str, Any]]:
+        """Most recent activities as dicts, oldest first"""
+        count = min(limit, self._activity_head, self.ACTIVITY_SLOTS)
+        return [
+            self._activity_ring[i % self.ACTIVITY_SLOTS].as_dict()
+            for i in range(self._activity_head - count, self._activity_head)
+        ]
+
+    @property
+    def recent_activity(self) -> List[Dict[str, Any]]:
+        """Recent activity list for compatibility"""
+        return self.get_recent_activity()
 
     async def update_system_stats(self):
         """Update system performance statistics"""
         try:
-            # Memory usage
-            process = psutil.Process()
-            self.memory_usage = process.memory_info().rss / 1024 / 1024  # MB
-            self.memory_percent = process.memory_percent()
-
-            # CPU usage
-            self.cpu_usage = process.cpu_percent()
+            # /proc reads happen on a worker thread so the loop keeps serving events
+            memory_rss, self.memory_percent, self.cpu_usage = await asyncio.get_running_loop().run_in_executor(
+                None, _sample_process, self._process
+            )
+            self.memory_usage = memory_rss / 1024 / 1024  # MB
 
             # Latency tracking
-            current_latency = round(self.latency * 1000, 2)
-            self.latency_history.append(current_latency)
-            if self.latency_history:
-                self.average_latency = sum(self.latency_history) / len(self.latency_history)
+            self._record_latency(round(self.latency * 1000, 2))
 
         except Exception as e:
             logger.debug(f"Error updating system stats: {e}")
 
+    def _record_latency(self, latency_ms: float):
+        """Add a latency sample and update the average from a running sum"""
+        if not math.isfinite(latency_ms):
+            return  # bot.latency is inf/nan before the first heartbeat; one would poison the sum for good
+        history = self.latency_history
+        if len(history) == history.maxlen:
+            self._latency_sum -= history[0]  # about to be evicted
+        history.append(latency_ms)
+        self._latency_sum += latency_ms
+        self.average_latency = self._latency_sum / len(history)
+
     # ===== BOT EVENTS =====
 
     async def on_ready(self):
@@ -579,89 +828,152 @@ class LadBot(commands.Bot):
         await self.load_command_stats()
 
         # Initialize latency tracking
-        current_latency = round(self.latency * 1000)
-        self.latency_history.append(current_latency)
-        self.average_latency = current_latency
+        latency_ms = round(self.latency * 1000, 2)
+        self._record_latency(latency_ms)
 
         # Update tracking variables
         self.unique_commands_used = len(self.command_usage)
+        self._member_count_total = sum(guild.member_count or 0 for guild in self.guilds)
         self.total_tracked_commands = self.total_commands_used
 
         # Log comprehensive startup info
         logger.info("🎮 ========== LADBOT READY ==========")
         logger.info(f"🤖 Bot: {self.user} (ID: {self.user.id})")
-        logger.info(f"📊 Connected to {len(self.guilds)} guilds")
-        logger.info(f"📈 Serving {sum(guild.member_count for guild in self.guilds)} users")
+        logger.info(f"📊 Connected to {self.guild_count} guilds")
+        logger.info(f"📈 Serving {self.member_count} users")
         logger.info(f"🎮 {len(self.commands)} commands available")
         logger.info(f"🔧 {len(self.extensions)} cogs loaded")
         logger.info(f"🗄️ Database ready: {self.database_ready}")
-        logger.info(f"⚡ Current latency: {current_latency}ms")
+        logger.info(f"⚡ Current latency: {latency_ms}ms")
 
         # Add to recent activity
-        self.add_activity("Bot started", f"Connected to {len(self.guilds)} servers with {len(self.commands)} commands")
+        self.add_activity("Bot started", f"Connected to {self.guild_count} servers with {len(self.commands)} commands")
 
     async def load_command_stats(self):
-        """Load command statistics from file"""
+        """Load command statistics from the snapshot plus any deltas saved since"""
+        if self._command_stats_loaded:
+            return  # on_ready fires again after reconnects; counts are additive
+
         try:
-            stats_file = self.data_manager.data_dir / "analytics" / "command_stats.json"
-            if stats_file.exists():
-                with open(stats_file, 'r') as f:
-                    data = json.load(f)
-                    self.command_usage.update(data.get('command_usage', {}))
-                    self.total_commands_used = data.get('total_commands_used', 0)
-                    self.commands_used_today = data.get('commands_used_today', 0)
-                    self.last_reset_date = data.get('last_reset_date', date.today().isoformat())
+            analytics_dir = self.data_manager.data_dir / "analytics"
+            stats_file = analytics_dir / "command_stats.json"
+            delta_file = analytics_dir / "command_stats.delta.jsonl"
 
+            records = await asyncio.get_running_loop().run_in_executor(
+                None, _read_stats_records, stats_file, delta_file
+            )
+            try:
+                for data in records:
+                    # Usage counts are cumulative; totals are absolute, so the newest wins
+                    self.command_usage.update(data.get('command_usage', {}))
+                    self.total_commands_used = data.get('total_commands_used', self.total_commands_used)
+                    self.commands_used_today = data.get('commands_used_today', self.commands_used_today)
+                    self.last_reset_date = data.get('last_reset_date', self.last_reset_date)
+            finally:
+                # The files were read, so later saves diff against what was applied rather than
+                # staying disabled for the whole run
+                self._saved_usage = dict(self.command_usage)
+                self._command_stats_loaded = True
+
+            if records:
                 logger.info(f"📊 Loaded command stats: {self.total_commands_used} total commands")
 
         except Exception as e:
             logger.error(f"Error loading command stats: {e}")
 
+    def _command_stats_record(self, command_usage: Dict[str, int]) -> Dict[str, Any]:
+        """Stats record with the given usage counts and the current totals"""
+        return {
+            'command_usage': command_usage,
+            'total_commands_used': self.total_commands_used,
+            'commands_used_today': self.commands_used_today,
+            'last_reset_date': self.last_reset_date,
+            'session_commands': self.session_commands,
+            'last_updated': datetime.now().isoformat()
+        }
+
     async def save_command_stats(self):
-        """Save command statistics to file"""
+        """Append the usage counted since the last save to the stats delta log"""
+        if not self._command_stats_loaded:
+            return  # The saved history isn't loaded yet; writing now would record it as lost
+
         try:
-            stats_file = self.data_manager.data_dir / "analytics" / "command_stats.json"
-            data = {
-                'command_usage': dict(self.command_usage),
-                'total_commands_used': self.total_commands_used,
-                'commands_used_today': self.commands_used_today,
-                'last_reset_date': self.last_reset_date,
-                'session_commands': self.session_commands,
-                'last_updated': datetime.now().isoformat()
-            }
+            delta_file = self.data_manager.data_dir / "analytics" / "command_stats.delta.jsonl"
+
+            async with self._stats_lock:
+                # Diff against the last save here, so counting a command stays a single increment
+                current = dict(self.command_usage)
+                saved = self._saved_usage
+                delta = {
+                    name: count - saved.get(name, 0)
+                    for name, count in current.items()
+                    if count != saved.get(name, 0)
+                }
+                line = _json_bytes(self._command_stats_record(delta)) + b"\n"
 
-            with open(stats_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                await asyncio.get_running_loop().run_in_executor(None, _append_line, delta_file, line)
+                self._saved_usage = current
 
         except Exception as e:
+            # The unsaved counts are still in the next diff
             logger.error(f"Error saving command stats: {e}")
 
+    async def compact_command_stats(self, backup: bool = False):
+        """Fold the delta log back into a full snapshot, optionally backing up settings in the same pass"""
+        if not self._command_stats_loaded:
+            return  # Compacting before the load would replace the saved history with empty counts
+
+        try:
+            analytics_dir = self.data_manager.data_dir / "analytics"
+            paths = (analytics_dir / "command_stats.json", analytics_dir / "command_stats.delta.jsonl")
+
+            async with self._stats_lock:
+                current = dict(self.command_usage)
+                content = _json_bytes(self._command_stats_record(current), indent=True)
+                loop = asyncio.get_running_loop()
+                if backup:
+                    await loop.run_in_executor(
+                        None, self.data_manager.backup_and_replace_snapshot, current, *paths, content
+                    )
+                else:
+                    await loop.run_in_executor(None, _replace_snapshot, *paths, content)
+                self._saved_usage = current
+
+        except Exception as e:
+            logger.error(f"Error compacting command stats: {e}")
+
     # ===== EVENT HANDLERS =====
 
     async def on_command_completion(self, ctx):
         """Track command usage"""
         command_name = ctx.command.name
 
-        # Update command usage
-        self.command_usage[command_name] += 1
+        # Update command usage; only a first use can change the unique count
+        usage = self.command_usage
+        if command_name in usage:
+            usage[command_name] += 1
+        else:
+            usage[command_name] = 1
+            self.unique_commands_used += 1
         self.total_commands_used += 1
         self.commands_used_today += 1
         self.session_commands += 1
 
-        # Check if we need to reset daily stats
-        today = date.today().isoformat()
-        if self.last_reset_date != today:
-            self.commands_used_today = 1
-            self.last_reset_date = today
-            logger.info("📅 Daily stats reset")
-
-        # Update unique commands count
-        self.unique_commands_used = len(self.command_usage)
+        # Check if we need to reset daily stats (the date is only read once the day can have changed)
+        now = time.monotonic()
+        if now >= self._next_reset_check:
+            # Re-check at least hourly in case the wall clock or DST moves midnight
+            self._next_reset_check = now + min(_seconds_until_midnight(), 3600)
+            today = date.today().isoformat()
+            if self.last_reset_date != today:
+                self.commands_used_today = 1
+                self.last_reset_date = today
+                logger.info("📅 Daily stats reset")
 
         # Add to recent activity
         self.add_activity("Command used", f"{ctx.author} used {command_name}")
 
-        logger.debug(f"📈 Command {command_name} used by {ctx.author} in {ctx.guild}")
+        logger.debug("📈 Command %s used by %s in %s", command_name, ctx.author, ctx.guild)
 
     async def on_command_error(self, ctx, error):
         """Enhanced error handling with tracking"""
@@ -685,11 +997,8 @@ class LadBot(commands.Bot):
 
         # Send user-friendly error message
         try:
-            embed = discord.Embed(
-                title="❌ Command Error",
-                description=f"Something went wrong with the `{ctx.command}` command.",
-                color=0xff0000
-            )
+            embed = _ERROR_EMBED.copy()
+            embed.description = f"Something went wrong with the `{ctx.command}` command."
             embed.add_field(
                 name="Error Details",
                 value=f"```{str(error)[:200]}```",
@@ -701,19 +1010,29 @@ class LadBot(commands.Bot):
 
     async def on_guild_join(self, guild):
         """Handle bot joining a new guild"""
+        self._member_count_total += guild.member_count or 0
         logger.info(f"🆕 Joined guild: {guild.name} (ID: {guild.id}, Members: {guild.member_count})")
         self.add_activity("Guild joined", f"Joined {guild.name} ({guild.member_count} members)")
 
     async def on_guild_remove(self, guild):
         """Handle bot leaving a guild"""
+        self._member_count_total -= guild.member_count or 0
         logger.info(f"👋 Left guild: {guild.name} (ID: {guild.id})")
         self.add_activity("Guild left", f"Left {guild.name}")
 
+    async def on_member_join(self, member):
+        """Keep the member total current (delivered only with ENABLE_MEMBER_INTENT)"""
+        self._member_count_total += 1
+
+    async def on_member_remove(self, member):
+        """Keep the member total current (delivered only with ENABLE_MEMBER_INTENT)"""
+        self._member_count_total -= 1
+
     # ===== BACKGROUND TASKS =====
 
     @tasks.loop(minutes=5)
     async def update_stats_loop(self):
-        """Update statistics every 5 minutes"""
+        """Update statistics every 5 minutes, and run the cleanup every hour"""
         try:
             await self.update_system_stats()
             await self.save_command_stats()
@@ -721,58 +1040,64 @@ class LadBot(commands.Bot):
             # Save analytics data
             analytics_data = {
                 'timestamp': datetime.now().isoformat(),
-                'guilds': len(self.guilds),
-                'users': len(self.users),
+                'guilds': self.guild_count,
+                'users': self.user_count,
                 'commands_today': self.commands_used_today,
                 'total_commands': self.total_commands_used,
                 'memory_usage': self.memory_usage,
                 'cpu_usage': self.cpu_usage,
                 'latency': round(self.latency * 1000, 2),
-                'uptime_seconds': (datetime.now() - self.startup_time).total_seconds(),
+                'uptime_seconds': self.uptime_seconds,
                 'database_ready': self.database_ready
             }
 
-            self.data_manager.save_analytics_data(analytics_data)
+            await asyncio.get_running_loop().run_in_executor(None, self.data_manager.save_analytics_data, analytics_data)
 
         except Exception as e:
             logger.error(f"Error in stats update loop: {e}")
 
+        # First tick and every hour after it
+        if self.update_stats_loop.current_loop % self.CLEANUP_EVERY_TICKS == 0:
+            await self.run_cleanup()
+
     @update_stats_loop.before_loop
     async def before_update_stats_loop(self):
         """Wait for bot to be ready before starting stats loop"""
         await self.wait_until_ready()
 
-    @tasks.loop(hours=1)
-    async def cleanup_loop(self):
-        """Cleanup task that runs every hour"""
+    async def run_cleanup(self):
+        """Hourly cleanup, run from the stats loop"""
         try:
             # Clear old cache entries
             self.data_manager.clear_cache()
 
-            # Create backup every 6 hours
-            current_hour = datetime.now().hour
-            if current_hour % 6 == 0:
-                self.data_manager.backup_settings()
+            # Fold the hour's stats deltas into the snapshot, with a backup every 6 hours of uptime
+            now_ns = time.monotonic_ns()
+            backup_due = now_ns - self._last_backup_ns >= self.BACKUP_INTERVAL_NS
+            if backup_due:
+                self._last_backup_ns = now_ns
+            await self.compact_command_stats(backup=backup_due)
 
-        except Exception as e:
-            logger.error(f"Error in cleanup loop: {e}")
+            # Keep a month of daily analytics logs
+            await asyncio.get_running_loop().run_in_executor(None, self.data_manager.prune_analytics)
 
-    @cleanup_loop.before_loop
-    async def before_cleanup_loop(self):
-        """Wait for bot to be ready before starting cleanup loop"""
-        await self.wait_until_ready()
+            # Exercise a pooled connection so a dead one surfaces here, not in a command check
+            if self.database_ready:
+                await self.db_manager.health_check()
+
+        except Exception as e:
+            logger.error(f"Error in cleanup: {e}")
 
     # ===== WEB DASHBOARD INTEGRATION =====
 
     def get_comprehensive_stats(self):
         """Get comprehensive stats for web dashboard"""
         try:
-            uptime = datetime.now() - self.startup_time
-            uptime_str = str(uptime).split('.')[0]  # Remove microseconds
+            uptime_str = str(timedelta(seconds=self.uptime_seconds))
 
             return {
-                'guilds': len(self.guilds),
-                'users': len(self.users),
+                'guilds': self.guild_count,
+                'users': self.user_count,
                 'commands': len(self.commands),
                 'latency': round(self.latency * 1000, 2),
                 'uptime': uptime_str,
@@ -788,7 +1113,8 @@ class LadBot(commands.Bot):
                 'loaded_cogs': len(self.extensions),
                 'average_latency': self.average_latency,
                 'database_ready': self.database_ready,
-                'recent_activity': list(self.recent_activity)[-10:],  # Last 10 activities
+                'database': self.db_manager.get_connection_info() if self.db_manager else None,
+                'recent_activity': self.get_recent_activity(10),  # Last 10 activities
                 'last_updated': datetime.now().isoformat()
             }
 
@@ -802,83 +1128,74 @@ class LadBot(commands.Bot):
             }
 
     async def close(self):
-        """Clean shutdown"""
+        """Clean shutdown; repeated calls wait on the shutdown already in progress"""
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.create_task(self._shutdown(), name="ladbot-shutdown")
+        await self._shutdown_task
+
+    async def _shutdown(self):
+        logger.info("🛑 Bot shutdown initiated")
+
+        # Stop the background loop and wait for it to unwind before tearing anything down
+        if self.update_stats_task.is_running():
+            background = self.update_stats_task.get_task()
+            self.update_stats_task.cancel()
+            await asyncio.gather(background, return_exceptions=True)
+
+        # The gateway teardown is slow and independent of our own cleanup; overlap the two
+        discord_close = asyncio.create_task(super().close())
         try:
-            logger.info("🛑 Bot shutdown initiated")
-
-            # Stop background tasks
-            if hasattr(self, 'update_stats_task'):
-                self.update_stats_task.cancel()
-
-            if hasattr(self, 'cleanup_task'):
-                self.cleanup_task.cancel()
-
-            # Save final stats
-            await self.save_command_stats()
-
-            # Create final backup
-            self.data_manager.backup_settings()
-
-            # Close database connections
+            # Final stats + backup (one worker job) and closing the database are independent; run them together
+            shutdown_steps = {
+                'save final stats and backup': self.compact_command_stats(backup=True),
+            }
             if self.db_manager:
-                await self.db_manager.close()
+                shutdown_steps['close database'] = self.db_manager.close()
+
+            # Step failures come back as results, so one failing step never skips the others
+            results = await asyncio.gather(*shutdown_steps.values(), return_exceptions=True)
+            for step, result in zip(shutdown_steps, results):
+                if isinstance(result, Exception):
+                    logger.error("Error during bot shutdown (%s): %s", step, result, exc_info=result)
 
             # Add shutdown activity
             self.add_activity("Bot shutdown", "Clean shutdown initiated")
 
             logger.info("✅ Bot shutdown complete")
-
-        except Exception as e:
-            logger.error(f"Error during bot shutdown: {e}")
-
-
-
         finally:
-
-            await super().close()
-
-        # ===== HELPER FUNCTIONS =====
-
-        def setup_bot() -> LadBot:
-
-            """Create and setup the bot instance"""
-
-            try:
-
-                bot = LadBot()
-
-                logger.info("✅ Bot instance created successfully")
-
-                return bot
-
-            except Exception as e:
-
-                logger.error(f"❌ Failed to create bot instance: {e}")
-
-                raise
-
-        if __name__ == "__main__":
-
-            # For testing purposes
-
-            import asyncio
-
-            from config.settings import settings
-
-            async def main():
-
-                bot = setup_bot()
-
-                try:
-
-                    await bot.start(settings.BOT_TOKEN)
-
-                except KeyboardInterrupt:
-
-                    logger.info("Bot stopped by user")
-
-                finally:
-
-                    await bot.close()
-
-            asyncio.run(main())
\ No newline at end of file
+            await discord_close
+
+
+# ===== HELPER FUNCTIONS =====
+
+def setup_bot() -> LadBot:
+    """Create and setup the bot instance"""
+    try:
+        bot = LadBot()
+        logger.info("✅ Bot instance created successfully")
+        return bot
+    except Exception as e:
+        logger.error("❌ Failed to create bot instance: %s", e)
+        raise
+
+
+if __name__ == "__main__":
+    # For testing purposes
+    from config.settings import settings
+
+    async def main():
+        # discord.py's Client.__aexit__ closes the bot, even if start() raises
+        async with setup_bot() as bot:
+            await bot.start(settings.BOT_TOKEN)
+
+    # Same loop choice as main.run_event_loop: uvloop when it is installed (POSIX only)
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
+    try:
+        run(main())
+    except KeyboardInterrupt:
+        logger.info("Bot stopped by user")
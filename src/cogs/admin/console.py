@@ -330,8 +330,8 @@ class Console(commands.Cog):
             embed.add_field(
                 name="🎯 Bot Information",
                 value=(
-                    f"**Guilds:** {len(self.bot.guilds)}\n"
-                    f"**Users:** {len(self.bot.users)}\n"
+                    f"**Guilds:** {self.bot.guild_count}\n"
+                    f"**Users:** {self.bot.user_count}\n"
                     f"**Commands:** {len(self.bot.commands)}\n"
                     f"**Latency:** {round(self.bot.latency * 1000)}ms"
                 ),
@@ -381,8 +381,8 @@ class Console(commands.Cog):
             embed.add_field(
                 name="🎯 Bot Information",
                 value=(
-                    f"**Guilds:** {len(self.bot.guilds)}\n"
-                    f"**Users:** {len(self.bot.users)}\n"
+                    f"**Guilds:** {self.bot.guild_count}\n"
+                    f"**Users:** {self.bot.user_count}\n"
                     f"**Commands:** {len(self.bot.commands)}\n"
                     f"**Latency:** {round(self.bot.latency * 1000)}ms"
                 ),
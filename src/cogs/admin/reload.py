@@ -201,10 +201,10 @@ class Reload(commands.Cog):
             # Basic stats
             cog_count = len(ctx.bot.cogs)
             command_count = len(list(ctx.bot.walk_commands()))
-            guild_count = len(ctx.bot.guilds)
+            guild_count = ctx.bot.guild_count
 
-            # Calculate total users
-            user_count = sum(guild.member_count or 0 for guild in ctx.bot.guilds)
+            # Total members, kept as a running count by the bot
+            user_count = ctx.bot.member_count
 
             embed = discord.Embed(
                 title="🤖 Ladbot Status",
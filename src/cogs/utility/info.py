@@ -43,7 +43,7 @@ class Info(commands.Cog):
             # Bot stats
             embed.add_field(
                 name="🤖 Bot Info",
-                value=f"**Guilds:** {len(self.bot.guilds)}\n**Users:** {len(self.bot.users)}\n**Commands:** {len(self.bot.commands)}",
+                value=f"**Guilds:** {self.bot.guild_count}\n**Users:** {self.bot.user_count}\n**Commands:** {len(self.bot.commands)}",
                 inline=True
             )
 
@@ -87,7 +87,7 @@ class Info(commands.Cog):
 
             embed.add_field(
                 name="🤖 Bot Info",
-                value=f"**Guilds:** {len(self.bot.guilds)}\n**Users:** {len(self.bot.users)}\n**Commands:** {len(self.bot.commands)}",
+                value=f"**Guilds:** {self.bot.guild_count}\n**Users:** {self.bot.user_count}\n**Commands:** {len(self.bot.commands)}",
                 inline=True
             )
 
@@ -95,6 +95,7 @@ class Settings:
         self.GAMES_ENABLED = os.getenv("GAMES_ENABLED", "true").lower() == "true"
         self.REDDIT_ENABLED = os.getenv("REDDIT_ENABLED", "false").lower() == "true"
         self.AI_FEATURES_ENABLED = os.getenv("AI_FEATURES_ENABLED", "false").lower() == "true"
+        self.ENABLE_MEMBER_INTENT = os.getenv("ENABLE_MEMBER_INTENT", "false").lower() == "true"
 
         # Monitoring and analytics
         self.PERFORMANCE_MONITORING = os.getenv("PERFORMANCE_MONITORING", "true").lower() == "true"
@@ -17,6 +17,13 @@ import asyncpg
 logger = logging.getLogger(__name__)
 
 
+def _decode_settings(value: Any) -> Dict[str, Any]:
+    """Settings column value as a dict; without a JSONB codec on the pool asyncpg returns it as text"""
+    if isinstance(value, (str, bytes)):
+        return json.loads(value)
+    return dict(value)
+
+
 class DatabaseManager:
     """
     Singleton Database Manager for Ladbot
@@ -101,11 +108,12 @@ class DatabaseManager:
                 await test_conn.execute('SELECT 1')
                 await test_conn.close()
 
-                # Create connection pool
+                # Create connection pool, sized for concurrent command checks
+                max_size = min(25, (os.cpu_count() or 1) * 4)
                 self.pool = await asyncpg.create_pool(
                     self.database_url,
-                    min_size=1,
-                    max_size=5,
+                    min_size=min(5, max_size),
+                    max_size=max_size,
                     timeout=30,
                     command_timeout=30,
                     server_settings={
@@ -276,7 +284,7 @@ class DatabaseManager:
             )
 
             if row and row['settings']:
-                settings = dict(row['settings'])
+                settings = _decode_settings(row['settings'])
                 value = settings.get(setting_name, default)
                 logger.debug(f"🔍 PostgreSQL: Guild {guild_id} setting {setting_name} = {value}")
                 return value
@@ -329,38 +337,25 @@ class DatabaseManager:
             return False
 
     async def _set_setting_postgresql(self, guild_id: int, setting_name: str, value: Any) -> bool:
-        """Set setting in PostgreSQL - FIXED VERSION"""
+        """Set setting in PostgreSQL - merged into the stored JSONB in one statement"""
         async with self.pool.acquire() as conn:
             try:
-                # Get existing settings
-                row = await conn.fetchrow(
-                    "SELECT settings FROM guild_settings WHERE guild_id = $1",
-                    guild_id
-                )
-
-                if row and row['settings']:
-                    # Convert JSONB to dict properly
-                    settings = dict(row['settings']) if isinstance(row['settings'], dict) else {}
-                else:
-                    settings = {}
+                # Only the changed keys travel; the server merges them, so there is no
+                # read-modify-write round trip and concurrent writes can't drop each other's keys
+                changes = json.dumps({
+                    setting_name: value,
+                    'last_updated': datetime.now().isoformat(),
+                    'last_updated_by': 'web_dashboard'
+                })
 
-                # Update the specific setting
-                settings[setting_name] = value
-                settings['last_updated'] = datetime.now().isoformat()
-                settings['last_updated_by'] = 'web_dashboard'
-
-                # Convert to JSON string for PostgreSQL
-                settings_json = json.dumps(settings)
-
-                # Upsert the settings with proper JSON handling
                 await conn.execute("""
                                    INSERT INTO guild_settings (guild_id, settings, updated_at)
-                                   VALUES ($1, $2::jsonb, CURRENT_TIMESTAMP) ON CONFLICT (guild_id) 
+                                   VALUES ($1, $2::jsonb, CURRENT_TIMESTAMP) ON CONFLICT (guild_id)
                     DO
                                    UPDATE SET
-                                       settings = $2::jsonb,
+                                       settings = COALESCE(guild_settings.settings, '{}'::jsonb) || EXCLUDED.settings,
                                        updated_at = CURRENT_TIMESTAMP
-                                   """, guild_id, settings_json)
+                                   """, guild_id, changes)
 
                 logger.info(f"✅ PostgreSQL: Set guild {guild_id} setting {setting_name} = {value}")
                 return True
@@ -433,7 +428,7 @@ class DatabaseManager:
             )
 
             if row and row['settings']:
-                settings = dict(row['settings'])
+                settings = _decode_settings(row['settings'])
                 logger.debug(f"🔍 PostgreSQL: Got {len(settings)} settings for guild {guild_id}")
                 return settings
             else:
@@ -457,6 +452,57 @@ class DatabaseManager:
                 logger.debug(f"🔍 SQLite: No settings found for guild {guild_id}")
                 return {}
 
+    async def get_settings_for_guilds(self, guild_ids: List[int]) -> Optional[Dict[int, Dict[str, Any]]]:
+        """
+        Get the settings of several guilds in a single query
+
+        Args:
+            guild_ids: Discord guild IDs
+
+        Returns:
+            Dictionary of guild ID to its settings; guilds without stored settings are omitted.
+            None if the query failed, so callers can tell an error apart from "no settings".
+        """
+        if not self.connection_healthy:
+            logger.warning(f"Database not healthy, cannot get settings for {len(guild_ids)} guilds")
+            return None
+
+        try:
+            if self.use_sqlite:
+                return await self._get_settings_for_guilds_sqlite(guild_ids)
+            else:
+                return await self._get_settings_for_guilds_postgresql(guild_ids)
+
+        except Exception as e:
+            logger.error(f"❌ Error getting settings for guilds {guild_ids}: {e}")
+            return None
+
+    async def _get_settings_for_guilds_postgresql(self, guild_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get settings for several guilds from PostgreSQL"""
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT guild_id, settings FROM guild_settings WHERE guild_id = ANY($1::bigint[])",
+                guild_ids
+            )
+
+            settings = {row['guild_id']: _decode_settings(row['settings']) for row in rows if row['settings']}
+            logger.debug(f"🔍 PostgreSQL: Got settings for {len(settings)}/{len(guild_ids)} guilds")
+            return settings
+
+    async def _get_settings_for_guilds_sqlite(self, guild_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get settings for several guilds from SQLite"""
+        placeholders = ", ".join("?" * len(guild_ids))
+        async with aiosqlite.connect(self.sqlite_path) as db:
+            cursor = await db.execute(
+                f"SELECT guild_id, settings FROM guild_settings WHERE guild_id IN ({placeholders})",
+                tuple(guild_ids)
+            )
+            rows = await cursor.fetchall()
+
+            settings = {row[0]: json.loads(row[1]) for row in rows if row[1]}
+            logger.debug(f"🔍 SQLite: Got settings for {len(settings)}/{len(guild_ids)} guilds")
+            return settings
+
     async def set_all_guild_settings(self, guild_id: int, settings: Dict[str, Any]) -> bool:
         """
         Set all settings for a guild (overwrites existing)
@@ -621,12 +667,16 @@ class DatabaseManager:
 
     def get_connection_info(self) -> Dict[str, Any]:
         """Get connection information for debugging"""
+        pool = self.pool if not self.use_sqlite else None
         return {
             'database_type': 'sqlite' if self.use_sqlite else 'postgresql',
             'connection_healthy': self.connection_healthy,
             'database_url_present': bool(self.database_url),
             'sqlite_path': str(self.sqlite_path) if self.use_sqlite else None,
-            'pool_ready': bool(self.pool) if not self.use_sqlite else None
+            'pool_ready': bool(pool) if not self.use_sqlite else None,
+            'pool_size': pool.get_size() if pool else None,
+            'pool_idle': pool.get_idle_size() if pool else None,
+            'pool_max_size': pool.get_max_size() if pool else None
         }
 
 
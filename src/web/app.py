@@ -6,28 +6,48 @@ and professional-grade error handling. Optimized for Railway/Render deployment.
 
 import os
 import sys
+import time
+import asyncio
+import atexit
+import queue
+import threading
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
+from collections import deque
 import json
-import traceback
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, List
 
 # Add project paths for clean imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 SRC_DIR = Path(__file__).parent.parent
 
-for path in [str(PROJECT_ROOT), str(SRC_DIR)]:
-    if path not in sys.path:
+_known_paths = set(sys.path)
+for path in (str(PROJECT_ROOT), str(SRC_DIR)):
+    if path not in _known_paths:
         sys.path.insert(0, path)
 
 # Flask and extensions
 from flask import Flask, render_template, session, redirect, url_for, request, jsonify, flash
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener, MemoryHandler
 import psutil
 
+# ASGI serving on the bot's event loop
+import uvicorn
+from concurrent.futures import ThreadPoolExecutor
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Project imports
 from config.settings import Settings
 settings = Settings()
@@ -35,9 +55,52 @@ settings = Settings()
 logger = logging.getLogger(__name__)
 
 
+class TimedMemoryHandler(MemoryHandler):
+    """MemoryHandler that drains its buffer when full, on errors, or on a fixed interval"""
+
+    def __init__(self, capacity: int, flush_interval: float = 1.0, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="WebLogFlushThread", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, with the stdlib encoder as fallback"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            # Dates still go through Flask's default() so responses keep their format
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 class LadbotWebApp:
     """Enhanced Flask application class for better organization"""
 
+    # How long one stats snapshot serves dashboard requests
+    STATS_CACHE_TTL = 1.0
+
     def __init__(self, bot=None):
         self.bot = bot
         self.app = None
@@ -46,6 +109,15 @@ class LadbotWebApp:
         self.error_count = 0
         self.commands_today = 0
         self.total_commands = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_deadline = 0.0
+
+    def attach_bot(self, bot):
+        """Hand the bot to a dashboard that was started before the bot existed"""
+        self.bot = bot
+        self._stats_cache = None
+        if self.app is not None:
+            self.app.bot = bot
 
     def create_app(self) -> Flask:
         """Create and configure Flask application with comprehensive features"""
@@ -58,6 +130,9 @@ class LadbotWebApp:
         app.bot = self.bot
         app.web_manager = self
 
+        if orjson is not None:
+            app.json = OrjsonProvider(app)
+
         # ===== CONFIGURATION =====
         self._configure_app(app)
 
@@ -169,7 +244,17 @@ class LadbotWebApp:
                     '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
                 ))
                 file_handler.setLevel(logging.INFO)
-                app.logger.addHandler(file_handler)
+
+                # Batch records: write every 200 records, on errors, or once a second
+                batch_handler = TimedMemoryHandler(200, flushLevel=logging.ERROR, target=file_handler)
+                batch_handler.setLevel(logging.INFO)
+
+                # Write from a listener thread so request handlers only enqueue records
+                log_queue = queue.SimpleQueue()
+                listener = QueueListener(log_queue, batch_handler, respect_handler_level=True)
+                listener.start()
+                atexit.register(listener.stop)
+                app.logger.addHandler(QueueHandler(log_queue))
 
                 app.logger.setLevel(logging.INFO)
                 app.logger.info('🚀 Ladbot web dashboard startup')
@@ -232,8 +317,8 @@ class LadbotWebApp:
                 health_data = {
                     'status': 'healthy' if self.bot.is_ready() else 'unhealthy',
                     'latency': round(self.bot.latency * 1000) if hasattr(self.bot, 'latency') else 0,
-                    'guilds': len(self.bot.guilds) if hasattr(self.bot, 'guilds') else 0,
-                    'users': len(self.bot.users) if hasattr(self.bot, 'users') else 0,
+                    'guilds': self.bot.guild_count if hasattr(self.bot, 'guild_count') else 0,
+                    'users': self.bot.user_count if hasattr(self.bot, 'user_count') else 0,
                     'uptime': self._calculate_uptime(),
                     'commands_loaded': len(self.bot.commands) if hasattr(self.bot, 'commands') else 0,
                     'cogs_loaded': len(self.bot.cogs) if hasattr(self.bot, 'cogs') else 0
@@ -272,11 +357,12 @@ class LadbotWebApp:
                 if not log_file.exists():
                     return jsonify({'error': 'Log file not found'}), 404
 
+                # Keep only the last 50 lines while reading, not the whole file
+                recent_lines = deque(maxlen=50)
+                total_lines = 0
                 with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-
-                # Get last 50 lines
-                recent_lines = lines[-50:] if len(lines) > 50 else lines
+                    for total_lines, line in enumerate(f, 1):
+                        recent_lines.append(line)
 
                 # Filter sensitive information
                 filtered_lines = []
@@ -290,7 +376,7 @@ class LadbotWebApp:
 
                 return jsonify({
                     'logs': filtered_lines,
-                    'total_lines': len(lines),
+                    'total_lines': total_lines,
                     'timestamp': datetime.now().isoformat()
                 })
 
@@ -372,8 +458,7 @@ class LadbotWebApp:
         @app.errorhandler(500)
         def internal_error(error):
             self.error_count += 1
-            logger.error(f"Internal server error: {error}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Internal server error: %s", error)
 
             if request.path.startswith('/api/'):
                 return jsonify({
@@ -387,8 +472,7 @@ class LadbotWebApp:
         @app.errorhandler(Exception)
         def handle_exception(e):
             self.error_count += 1
-            logger.error(f"Unhandled exception: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Unhandled exception: %s", e)
 
             if request.path.startswith('/api/'):
                 return jsonify({
@@ -526,7 +610,19 @@ class LadbotWebApp:
     # ===== DATA MANAGEMENT METHODS =====
 
     def _get_comprehensive_stats(self) -> Dict[str, Any]:
-        """Get comprehensive bot and system statistics"""
+        """Get comprehensive bot and system statistics, reusing a snapshot for STATS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached is None or now >= self._stats_cache_deadline:
+            cached = self._build_comprehensive_stats()
+            if 'error' not in cached:
+                self._stats_cache = cached
+                self._stats_cache_deadline = now + self.STATS_CACHE_TTL
+        # Routes add their own keys; hand each caller its own top-level dict
+        return dict(cached)
+
+    def _build_comprehensive_stats(self) -> Dict[str, Any]:
+        """Collect bot, system and web statistics"""
         try:
             stats = {
                 'timestamp': datetime.now().isoformat(),
@@ -540,8 +636,8 @@ class LadbotWebApp:
                 try:
                     stats.update({
                         'bot_status': 'online' if self.bot.is_ready() else 'offline',
-                        'guilds': len(self.bot.guilds) if hasattr(self.bot, 'guilds') else 0,
-                        'users': len(self.bot.users) if hasattr(self.bot, 'users') else 0,
+                        'guilds': self.bot.guild_count if hasattr(self.bot, 'guild_count') else 0,
+                        'users': self.bot.user_count if hasattr(self.bot, 'user_count') else 0,
                         'commands': len(self.bot.commands) if hasattr(self.bot, 'commands') else 0,
                         'latency': round(self.bot.latency * 1000) if hasattr(self.bot, 'latency') else 0,
                         'loaded_cogs': len(self.bot.cogs) if hasattr(self.bot, 'cogs') else 0,
@@ -664,8 +760,8 @@ class LadbotWebApp:
                 try:
                     analytics.update({
                         'loaded_cogs': len(self.bot.cogs),
-                        'total_guilds': len(self.bot.guilds),
-                        'total_users': len(self.bot.users),
+                        'total_guilds': self.bot.guild_count,
+                        'total_users': self.bot.user_count,
                         'bot_latency': round(self.bot.latency * 1000) if hasattr(self.bot, 'latency') else 0
                     })
                 except:
@@ -805,7 +901,7 @@ class LadbotWebApp:
 
                 activities.append({
                     'action': 'Statistics Update',
-                    'details': f'Serving {len(self.bot.guilds)} servers',
+                    'details': f'Serving {self.bot.guild_count} servers',
                     'timestamp': datetime.now() - timedelta(minutes=5),
                     'type': 'info',
                     'icon': 'fas fa-chart-bar',
@@ -844,7 +940,7 @@ class LadbotWebApp:
                     health.update({
                         'response_time': round(self.bot.latency * 1000) if hasattr(self.bot, 'latency') else 0,
                         'bot_ready': self.bot.is_ready() if hasattr(self.bot, 'is_ready') else False,
-                        'guilds_connected': len(self.bot.guilds) if hasattr(self.bot, 'guilds') else 0
+                        'guilds_connected': self.bot.guild_count if hasattr(self.bot, 'guild_count') else 0
                     })
                 except Exception as e:
                     logger.warning(f"Could not get bot health metrics: {e}")
@@ -894,14 +990,9 @@ def run_web_server(bot=None, host='0.0.0.0', port=8080, debug=False):
 
         if settings.IS_PRODUCTION:
             logger.info("🏭 Running in production mode")
-            # Use Werkzeug's built-in server with threading
-            app.run(
-                host=host,
-                port=port,
-                debug=False,
-                threaded=True,
-                use_reloader=False
-            )
+            # Use waitress instead of Werkzeug's development server
+            from waitress import serve
+            serve(app, host=host, port=port, threads=4, channel_timeout=30)
         else:
             logger.info("🔧 Running in development mode")
             app.run(
@@ -912,8 +1003,7 @@ def run_web_server(bot=None, host='0.0.0.0', port=8080, debug=False):
             )
 
     except Exception as e:
-        logger.error(f"❌ Web server failed to start: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Web server failed to start: %s", e)
         raise
 
 
@@ -923,6 +1013,134 @@ def create_app(bot=None):
     return web_manager.create_app()
 
 
+# ===== EMBEDDED ASGI SERVER =====
+
+class EmbeddedServer(uvicorn.Server):
+    """uvicorn server that shares the bot's event loop and leaves signals to the bot"""
+
+    def __init__(self, config: uvicorn.Config, web_manager: 'LadbotWebApp',
+                 wsgi_executor: Optional[ThreadPoolExecutor] = None):
+        super().__init__(config)
+        self.web_manager = web_manager
+        self.wsgi_executor = wsgi_executor
+        self.ready = asyncio.Event()
+
+    async def startup(self, sockets=None) -> None:
+        """Signal readiness as soon as the listening sockets are bound"""
+        await super().startup(sockets=sockets)
+        if self.started:
+            self.ready.set()
+
+    async def serve(self, sockets=None) -> None:
+        """Serve until should_exit; a failed bind must not exit the whole bot"""
+        try:
+            await super().serve(sockets=sockets)
+        except SystemExit:
+            logger.error("❌ Web server could not start (is the port already in use?)")
+
+    def install_signal_handlers(self) -> None:
+        """Signal handling is owned by the bot process (uvicorn < 0.29)"""
+
+    @contextmanager
+    def capture_signals(self):
+        """Signal handling is owned by the bot process (uvicorn >= 0.29)"""
+        yield
+
+
+class ThreadPoolWsgiToAsgiInstance(WsgiToAsgiInstance):
+    """Runs the WSGI request on the dashboard's thread pool rather than asgiref's single sync thread"""
+
+    def __init__(self, wsgi_application, executor: ThreadPoolExecutor):
+        super().__init__(wsgi_application)
+        run_wsgi_app = WsgiToAsgiInstance.__dict__['run_wsgi_app'].func.__get__(self)
+        self.run_wsgi_app = sync_to_async(run_wsgi_app, thread_sensitive=False, executor=executor)
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    """WsgiToAsgi that lets blocking Flask views run concurrently instead of one at a time
+
+    Views get their own bounded pool: they can block for seconds waiting on the bot loop, and
+    on the loop's default executor they would starve the bot's own psutil, stats and backup jobs.
+    """
+
+    max_workers = 8
+
+    def __init__(self, wsgi_application):
+        super().__init__(wsgi_application)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dashboard")
+
+    async def __call__(self, scope, receive, send):
+        await ThreadPoolWsgiToAsgiInstance(self.wsgi_application, self.executor)(scope, receive, send)
+
+
+class HealthCheckMiddleware:
+    """ASGI middleware answering health probes on the event loop; other requests go to Flask"""
+
+    HEALTH_PATHS = frozenset({'/health', '/healthz', '/_health'})
+
+    # Pre-encoded response body; only the timestamp and uptime change per probe
+    HEALTH_TEMPLATE = b'{"status":"healthy","timestamp":"%s","uptime":"%s","version":"2.0"}'
+
+    def __init__(self, app, web_manager: 'LadbotWebApp'):
+        self.app = app
+        self.web_manager = web_manager
+
+        # Health body cache, refreshed at most once per second
+        self._health_body = b''
+        self._health_body_at = 0.0
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            path = scope['path']
+            if path in self.HEALTH_PATHS:
+                return await self._respond(send, self._health_payload(), b'application/json')
+            if path == '/ping':
+                return await self._respond(send, b'pong', b'text/plain')
+
+        await self.app(scope, receive, send)
+
+    def _health_payload(self) -> bytes:
+        """Health body with a timestamp of one-second resolution"""
+        now = time.time()
+        if now - self._health_body_at >= 1.0:
+            self._health_body = self.HEALTH_TEMPLATE % (
+                datetime.fromtimestamp(now).isoformat().encode(),
+                self.web_manager._calculate_uptime().encode()
+            )
+            self._health_body_at = now
+        return self._health_body
+
+    @staticmethod
+    async def _respond(send, body: bytes, content_type: bytes) -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', content_type),
+                (b'content-length', str(len(body)).encode()),
+                (b'x-content-type-options', b'nosniff'),
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+
+def create_asgi_server(bot=None, host='0.0.0.0', port=8080) -> EmbeddedServer:
+    """Wrap the Flask dashboard for ASGI and build a server to await on the running loop"""
+    app = create_app(bot)
+    wsgi_app = ThreadPoolWsgiToAsgi(app)
+
+    config = uvicorn.Config(
+        HealthCheckMiddleware(wsgi_app, app.web_manager),
+        host=host,
+        port=port,
+        log_level="warning",
+        loop="none",  # serve() runs on the caller's loop
+        lifespan="off"
+    )
+
+    return EmbeddedServer(config, app.web_manager, wsgi_app.executor)
+
+
 if __name__ == '__main__':
     # Standalone mode for testing
     print("🚀 Starting Ladbot Web Dashboard in standalone mode...")
@@ -7,18 +7,15 @@ FIXED: All async event loop issues resolved - FULL FEATURE VERSION
 from flask import render_template, session, redirect, url_for, request, jsonify, flash, current_app
 import logging
 from datetime import datetime, timedelta
+from collections import deque
 import traceback
 from typing import Dict, Any, Optional, List
 import json
-import sys
-import os
 from pathlib import Path
 import asyncio
 import concurrent.futures
 import psutil
 
-# Fix the import path issue
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.database import db_manager
 
 try:
@@ -654,6 +651,8 @@ def register_routes(app):
                     else:
                         logger.error(f"❌ WEB: Failed to set {setting_name} for guild {guild_id}")
 
+                # The bot caches setting reads; make the change visible immediately
+                app.bot.reload_guild_settings(int(guild_id))
                 return success_count, total_count
 
             success_count, total_count = run_async_in_bot_loop(save_all_settings())
@@ -915,6 +914,7 @@ def register_routes(app):
                                     success = await db_manager.set_guild_setting(guild_id, setting_name, value)
                                     if success:
                                         import_count += 1
+                                app.bot.reload_guild_settings(guild_id)
                             except (ValueError, Exception) as e:
                                 logger.warning(f"Failed to import settings for {guild_id_str}: {e}")
                         return import_count
@@ -1079,8 +1079,8 @@ def register_routes(app):
                     'bot_status': {
                         'connected': app.bot is not None and app.bot.is_ready() if app.bot else False,
                         'latency': round(app.bot.latency * 1000, 2) if app.bot else None,
-                        'guilds': len(app.bot.guilds) if app.bot else 0,
-                        'users': len(app.bot.users) if app.bot else 0
+                        'guilds': app.bot.guild_count if app.bot else 0,
+                        'users': app.bot.user_count if app.bot else 0
                     },
                     'database': {
                         'healthy': db_manager.connection_healthy if 'db_manager' in globals() else False,
@@ -1134,10 +1134,9 @@ def register_routes(app):
                         'error': 'Log file not found'
                     }), 404
 
-                # Read last 100 lines
+                # Read last 100 lines, without holding the rest of the file
                 with open(log_file, 'r') as f:
-                    lines = f.readlines()
-                    recent_lines = lines[-100:] if len(lines) > 100 else lines
+                    recent_lines = deque(f, maxlen=100)
 
                 log_entries = []
                 for line in recent_lines:
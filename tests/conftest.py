@@ -0,0 +1,8 @@
+"""Shared test setup: make the project root and src importable like main.py does"""
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
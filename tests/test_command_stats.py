@@ -0,0 +1,64 @@
+"""Command stats persistence: loading the snapshot plus the delta log"""
+import asyncio
+import json
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("psutil")
+
+from bot.ladbot import LadBot, _read_stats_records  # noqa: E402
+
+
+def _write_stats(tmp_path, delta_bytes):
+    snapshot = tmp_path / "command_stats.json"
+    log = tmp_path / "command_stats.delta.jsonl"
+    snapshot.write_text(json.dumps({'command_usage': {'ping': 2}, 'total_commands_used': 2}))
+    log.write_bytes(delta_bytes)
+    return snapshot, log
+
+
+def test_truncated_delta_line_is_dropped_and_cut(tmp_path):
+    snapshot, log = _write_stats(
+        tmp_path,
+        b'{"command_usage":{"ping":1},"total_commands_used":3}\n{"command_usage":{"he'
+    )
+
+    records = _read_stats_records(snapshot, log)
+
+    assert [r['total_commands_used'] for r in records] == [2, 3]
+    # The partial line is gone, so the next append starts on its own line
+    assert log.read_bytes() == b'{"command_usage":{"ping":1},"total_commands_used":3}\n'
+
+
+def test_undecodable_delta_line_is_skipped(tmp_path):
+    snapshot, log = _write_stats(tmp_path, b'{"command_usage":{"ping":1}}\nnot json\n{"command_usage":{"help":1}}\n')
+
+    records = _read_stats_records(snapshot, log)
+
+    assert [r['command_usage'] for r in records] == [{'ping': 2}, {'ping': 1}, {'help': 1}]
+
+
+def test_load_from_truncated_delta_marks_stats_loaded(tmp_path):
+    analytics = tmp_path / "analytics"
+    analytics.mkdir()
+    (analytics / "command_stats.json").write_text(json.dumps({'command_usage': {'ping': 2}}))
+    (analytics / "command_stats.delta.jsonl").write_bytes(b'{"command_usage":{"ping":1}}\n{"comm')
+
+    bot = SimpleNamespace(
+        _command_stats_loaded=False,
+        data_manager=SimpleNamespace(data_dir=tmp_path),
+        command_usage=Counter(),
+        _saved_usage={},
+        total_commands_used=0,
+        commands_used_today=0,
+        last_reset_date=None,
+    )
+
+    asyncio.run(LadBot.load_command_stats(bot))
+
+    assert bot._command_stats_loaded
+    assert bot.command_usage == Counter(ping=3)
+    assert bot._saved_usage == {'ping': 3}
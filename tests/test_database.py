@@ -0,0 +1,48 @@
+"""DatabaseManager settings decoding"""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("aiosqlite")
+
+from utils.database import DatabaseManager  # noqa: E402
+
+
+class _FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetch(self, query, *args):
+        return self.rows
+
+
+class _FakePool:
+    def __init__(self, rows):
+        self.connection = _FakeConnection(rows)
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return pool.connection
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+
+def test_postgresql_batch_decodes_text_jsonb(monkeypatch):
+    manager = DatabaseManager()
+    rows = [
+        {'guild_id': 1, 'settings': json.dumps({'ping': False})},  # no JSONB codec: text
+        {'guild_id': 2, 'settings': {'help': True}},  # codec installed: already decoded
+    ]
+    monkeypatch.setattr(manager, 'pool', _FakePool(rows), raising=False)
+
+    settings = asyncio.run(manager._get_settings_for_guilds_postgresql([1, 2, 3]))
+
+    assert settings == {1: {'ping': False}, 2: {'help': True}}
@@ -0,0 +1,48 @@
+"""load_env_file parsing of .env lines"""
+import pytest
+
+import main
+
+
+@pytest.fixture
+def load(tmp_path, monkeypatch):
+    def _load(text, *keys):
+        for key in keys:
+            monkeypatch.delenv(key, raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text(text, encoding='utf-8')
+        main.load_env_file(env_file)
+        return {key: main.os.environ.get(key) for key in keys}
+    return _load
+
+
+def test_quoted_value_with_trailing_comment(load):
+    values = load(
+        'LADBOT_A="value # kept" # comment\n'
+        "LADBOT_B='single' # comment\n",
+        'LADBOT_A', 'LADBOT_B'
+    )
+
+    assert values == {'LADBOT_A': 'value # kept', 'LADBOT_B': 'single'}
+
+
+def test_plain_values(load):
+    values = load(
+        '# comment line\n'
+        'export LADBOT_C=plain # comment\n'
+        'LADBOT_D="quoted"\n'
+        'LADBOT_E=a=b\n',
+        'LADBOT_C', 'LADBOT_D', 'LADBOT_E'
+    )
+
+    assert values == {'LADBOT_C': 'plain', 'LADBOT_D': 'quoted', 'LADBOT_E': 'a=b'}
+
+
+def test_existing_variables_win(tmp_path, monkeypatch):
+    monkeypatch.setenv('LADBOT_F', 'from-env')
+    env_file = tmp_path / ".env"
+    env_file.write_text('LADBOT_F="from-file"\n', encoding='utf-8')
+
+    main.load_env_file(env_file)
+
+    assert main.os.environ['LADBOT_F'] == 'from-env'
@@ -0,0 +1,23 @@
+"""Atomic file writes used for stats snapshots and analytics"""
+import threading
+
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("psutil")
+
+from bot.ladbot import _write_atomic  # noqa: E402
+
+
+def test_concurrent_writers_each_publish_a_complete_file(tmp_path):
+    target = tmp_path / "command_stats.json"
+    payloads = [bytes([ord('a') + i]) * 200_000 for i in range(8)]
+
+    threads = [threading.Thread(target=_write_atomic, args=(target, payload)) for payload in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert target.read_bytes() in payloads
+    assert [p.name for p in tmp_path.iterdir()] == ["command_stats.json"]  # no temp files left behind
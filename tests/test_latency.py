@@ -0,0 +1,33 @@
+"""Running average of gateway latency samples"""
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("psutil")
+
+from bot.ladbot import LadBot  # noqa: E402
+
+
+def _tracker(maxlen=3):
+    return SimpleNamespace(latency_history=deque(maxlen=maxlen), _latency_sum=0.0, average_latency=0)
+
+
+def test_average_follows_the_window():
+    bot = _tracker()
+    for sample in (10.0, 20.0, 30.0, 40.0):
+        LadBot._record_latency(bot, sample)
+
+    assert bot.average_latency == pytest.approx(30.0)
+
+
+@pytest.mark.parametrize("bad", [float('inf'), float('nan')])
+def test_non_finite_samples_are_ignored(bad):
+    bot = _tracker()
+    LadBot._record_latency(bot, 10.0)
+    LadBot._record_latency(bot, bad)
+    LadBot._record_latency(bot, 20.0)
+
+    assert list(bot.latency_history) == [10.0, 20.0]
+    assert bot.average_latency == pytest.approx(15.0)
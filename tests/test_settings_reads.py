@@ -0,0 +1,54 @@
+"""Batched guild setting reads"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("psutil")
+
+from bot.ladbot import LadBot  # noqa: E402
+
+
+class _FakeDatabase:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def get_settings_for_guilds(self, guild_ids):
+        self.calls += 1
+        return self.result
+
+
+def _bot(database):
+    bot = object.__new__(LadBot)
+    bot.database_ready = True
+    bot.db_manager = database
+    bot.settings_cache = {}
+    bot._pending_setting_reads = {}
+    bot._settings_flush_task = None
+    return bot
+
+
+def test_failed_batch_returns_default_without_caching():
+    database = _FakeDatabase(None)
+    bot = _bot(database)
+
+    async def read_twice():
+        first = await bot.get_setting(1, 'ping', default=True)
+        second = await bot.get_setting(1, 'ping', default=True)
+        return first, second
+
+    assert asyncio.run(read_twice()) == (True, True)
+    assert bot.settings_cache == {}
+    assert database.calls == 2  # nothing cached, so the second read retried the database
+
+
+def test_successful_batch_is_cached():
+    database = _FakeDatabase({1: {'ping': False}})
+    bot = _bot(database)
+
+    async def read_twice():
+        return await bot.get_setting(1, 'ping'), await bot.get_setting(1, 'ping')
+
+    assert asyncio.run(read_twice()) == (False, False)
+    assert database.calls == 1
@@ -0,0 +1,48 @@
+"""WSGI-to-ASGI adapter that runs Flask views on the dashboard's own thread pool"""
+import asyncio
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("uvicorn")
+
+os.environ.setdefault("BOT_TOKEN", "test-token")  # config.settings validates it at import
+
+from flask import Flask  # noqa: E402
+from web.app import ThreadPoolWsgiToAsgi  # noqa: E402
+
+
+def _call(asgi_app, path="/"):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": path, "query_string": b"", "headers": [],
+        "http_version": "1.1", "scheme": "http", "server": ("test", 80), "root_path": "",
+    }
+    asyncio.run(asgi_app(scope, receive, send))
+    return messages
+
+
+def test_views_run_on_the_dashboard_pool():
+    flask_app = Flask(__name__)
+
+    @flask_app.route("/")
+    def thread_name():
+        return threading.current_thread().name
+
+    adapter = ThreadPoolWsgiToAsgi(flask_app)
+    try:
+        messages = _call(adapter)
+    finally:
+        adapter.executor.shutdown()
+
+    assert messages[0]["status"] == 200
+    assert messages[1]["body"].startswith(b"dashboard")
@@ -0,0 +1,38 @@
+"""WebServerManager fallback health responder"""
+import asyncio
+import socket
+
+import main
+
+
+def test_fallback_bind_failure_is_not_fatal():
+    held = socket.socket()
+    held.bind(("127.0.0.1", 0))
+    held.listen()
+    try:
+        manager = main.WebServerManager()
+        manager.host, manager.port = held.getsockname()
+
+        started = asyncio.run(manager.start_fallback_server())
+    finally:
+        held.close()
+
+    assert started is False
+    assert manager.fallback_server is None
+
+
+def test_fallback_answers_health_probes():
+    async def probe():
+        manager = main.WebServerManager()
+        manager.host, manager.port = "127.0.0.1", 0
+        assert await manager.start_fallback_server()
+        port = manager.fallback_server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET / HTTP/1.1\r\nHost: test\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+        await manager.stop_web_server()
+        return response
+
+    assert asyncio.run(probe()).startswith(b"HTTP/1.1 200 OK")